@@ -0,0 +1,364 @@
+"""Benchmark aiofiles against sync `open` and raw `run_in_executor`.
+
+Every operation is run three ways:
+
+- sync: the blocking stdlib call, made on the event loop thread.
+- executor: the same blocking calls, each awaited through
+  `loop.run_in_executor` on the loop's default executor.
+- aiofiles: the aiofiles calls.
+
+The executor and aiofiles variants are run by 1, 16 and 64 concurrent tasks
+(`--concurrency`), each task using its own file object. Reported times are
+per operation (per line for `lines`).
+
+Run with `python benchmarks/bench_aiofiles.py -o report.json`, and compare
+two reports with `python -m pyperf compare_to old.json new.json`. Pass
+`--bench` to select benchmarks, and see `--help` for pyperf's own options.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from functools import partial
+from typing import Callable, NamedTuple, Optional
+
+import pyperf
+
+import aiofiles
+import aiofiles.os
+import aiofiles.tempfile
+
+SMALL = 4 * 1024
+LARGE = 1024 * 1024
+LINES = 1000
+SPOOL_SIZE = 64 * 1024
+SPOOL_CHUNK = 16 * 1024
+
+IMPLS = ("sync", "executor", "aiofiles")
+
+
+def _run(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+class Benchmark(NamedTuple):
+    name: str
+    # Create the files the tasks use in a directory, returning what each
+    # task is handed: a path, or a file opened in `mode` if it's set.
+    prepare: Callable
+    sync: Callable
+    executor: Callable
+    aiofiles: Callable
+    mode: Optional[str] = None
+    ops: int = 1  # Operations per call, for times per operation.
+
+
+def _shared_file(data, directory, tasks):
+    path = os.path.join(directory, "shared")
+    with open(path, "wb") as f:
+        f.write(data)
+    return [path] * tasks
+
+
+def _own_files(data, directory, tasks):
+    paths = [os.path.join(directory, f"task-{i}") for i in range(tasks)]
+    for path in paths:
+        with open(path, "wb") as f:
+            f.write(data)
+    return paths
+
+
+def _directory(directory, tasks):
+    return [directory] * tasks
+
+
+# open_close
+
+
+def _open_close_sync(path):
+    open(path, "rb").close()  # noqa: SIM115
+
+
+async def _open_close_executor(path):
+    f = await _run(open, path, "rb")
+    await _run(f.close)
+
+
+async def _open_close_aiofiles(path):
+    f = await aiofiles.open(path, "rb")
+    await f.close()
+
+
+# read
+
+
+def _read_sync(size, f):
+    f.seek(0)
+    f.read(size)
+
+
+async def _read_executor(size, f):
+    await _run(f.seek, 0)
+    await _run(f.read, size)
+
+
+async def _read_aiofiles(size, f):
+    await f.seek(0)
+    await f.read(size)
+
+
+# write
+
+
+def _write_sync(data, f):
+    f.seek(0)
+    f.write(data)
+
+
+async def _write_executor(data, f):
+    await _run(f.seek, 0)
+    await _run(f.write, data)
+
+
+async def _write_aiofiles(data, f):
+    await f.seek(0)
+    await f.write(data)
+
+
+# lines
+
+
+def _lines_sync(f):
+    f.seek(0)
+    for _ in f:
+        pass
+
+
+async def _lines_executor(f):
+    await _run(f.seek, 0)
+    while await _run(f.readline):
+        pass
+
+
+async def _lines_aiofiles(f):
+    await f.seek(0)
+    async for _ in f:
+        pass
+
+
+# stat
+
+
+async def _stat_executor(path):
+    await _run(os.stat, path)
+
+
+# tempfile
+
+
+def _tempfile_sync(directory):
+    tempfile.TemporaryFile(dir=directory).close()  # noqa: SIM115
+
+
+async def _tempfile_executor(directory):
+    f = await _run(tempfile.TemporaryFile, dir=directory)
+    await _run(f.close)
+
+
+async def _tempfile_aiofiles(directory):
+    async with aiofiles.tempfile.TemporaryFile(dir=directory):
+        pass
+
+
+# spooled_rollover: writing twice the spool size rolls over to a file.
+
+_SPOOL_CHUNKS = [os.urandom(SPOOL_CHUNK)] * (2 * SPOOL_SIZE // SPOOL_CHUNK)
+
+
+def _spooled_sync(directory):
+    with tempfile.SpooledTemporaryFile(SPOOL_SIZE, dir=directory) as f:
+        for chunk in _SPOOL_CHUNKS:
+            f.write(chunk)
+
+
+async def _spooled_executor(directory):
+    f = tempfile.SpooledTemporaryFile(SPOOL_SIZE, dir=directory)  # noqa: SIM115
+    for chunk in _SPOOL_CHUNKS:
+        await _run(f.write, chunk)
+    await _run(f.close)
+
+
+async def _spooled_aiofiles(directory):
+    async with aiofiles.tempfile.SpooledTemporaryFile(SPOOL_SIZE, dir=directory) as f:
+        for chunk in _SPOOL_CHUNKS:
+            await f.write(chunk)
+
+
+_LINES_DATA = b"".join(b"line %d of a text file\n" % i for i in range(LINES))
+
+BENCHMARKS = [
+    Benchmark(
+        "open_close",
+        partial(_shared_file, b"data"),
+        _open_close_sync,
+        _open_close_executor,
+        _open_close_aiofiles,
+    ),
+    Benchmark(
+        "read_small",
+        partial(_shared_file, os.urandom(SMALL)),
+        partial(_read_sync, SMALL),
+        partial(_read_executor, SMALL),
+        partial(_read_aiofiles, SMALL),
+        mode="rb",
+    ),
+    Benchmark(
+        "read_large",
+        partial(_shared_file, os.urandom(LARGE)),
+        partial(_read_sync, LARGE),
+        partial(_read_executor, LARGE),
+        partial(_read_aiofiles, LARGE),
+        mode="rb",
+    ),
+    Benchmark(
+        "write_small",
+        partial(_own_files, b""),
+        partial(_write_sync, os.urandom(SMALL)),
+        partial(_write_executor, os.urandom(SMALL)),
+        partial(_write_aiofiles, os.urandom(SMALL)),
+        mode="wb",
+    ),
+    Benchmark(
+        "write_large",
+        partial(_own_files, b""),
+        partial(_write_sync, os.urandom(LARGE)),
+        partial(_write_executor, os.urandom(LARGE)),
+        partial(_write_aiofiles, os.urandom(LARGE)),
+        mode="wb",
+    ),
+    Benchmark(
+        "lines",
+        partial(_shared_file, _LINES_DATA),
+        _lines_sync,
+        _lines_executor,
+        _lines_aiofiles,
+        mode="r",
+        ops=LINES,
+    ),
+    Benchmark(
+        "stat",
+        partial(_own_files, b"data"),
+        os.stat,
+        _stat_executor,
+        aiofiles.os.stat,
+    ),
+    Benchmark(
+        "tempfile",
+        _directory,
+        _tempfile_sync,
+        _tempfile_executor,
+        _tempfile_aiofiles,
+    ),
+    Benchmark(
+        "spooled_rollover",
+        _directory,
+        _spooled_sync,
+        _spooled_executor,
+        _spooled_aiofiles,
+    ),
+]
+
+
+async def _open(impl, mode, path):
+    if mode is None:
+        return path
+    if impl == "aiofiles":
+        return await aiofiles.open(path, mode)
+    return open(path, mode)  # noqa: SIM115, ASYNC230
+
+
+async def _close(impl, mode, state):
+    if mode is None:
+        return
+    if impl == "aiofiles":
+        await state.close()
+    else:
+        state.close()
+
+
+async def _task(op, state, loops):
+    for _ in range(loops):
+        await op(state)
+
+
+async def _time_async(bench, impl, tasks, loops):
+    op = getattr(bench, impl)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = bench.prepare(directory, tasks)
+        states = [await _open(impl, bench.mode, path) for path in paths]
+        try:
+            if impl == "sync":
+                op(states[0])  # Warm up.
+                start = time.perf_counter()
+                for _ in range(loops):
+                    op(states[0])
+                return time.perf_counter() - start
+            # Warm up, which also starts the worker threads.
+            await asyncio.gather(*(op(state) for state in states))
+            start = time.perf_counter()
+            await asyncio.gather(*(_task(op, state, loops) for state in states))
+            return time.perf_counter() - start
+        finally:
+            for state in states:
+                await _close(impl, bench.mode, state)
+
+
+def _time(loops, bench, impl, tasks):
+    return asyncio.run(_time_async(bench, impl, tasks, loops))
+
+
+def _add_cmdline_args(cmd, args):
+    cmd.extend(["--concurrency", args.concurrency])
+    if args.bench:
+        cmd.extend(["--bench", args.bench])
+
+
+def main():
+    runner = pyperf.Runner(add_cmdline_args=_add_cmdline_args)
+    runner.metadata["description"] = __doc__.splitlines()[0]
+    runner.argparser.add_argument(
+        "--concurrency",
+        default="1,16,64",
+        help="comma-separated numbers of concurrent tasks (default: 1,16,64)",
+    )
+    runner.argparser.add_argument(
+        "--bench",
+        default="",
+        help="comma-separated names of the benchmarks to run (default: all)",
+    )
+    args = runner.parse_args()
+    concurrency = [int(tasks) for tasks in args.concurrency.split(",")]
+    selected = set(args.bench.split(",")) if args.bench else None
+
+    for bench in BENCHMARKS:
+        if selected is not None and bench.name not in selected:
+            continue
+        runner.bench_time_func(
+            f"{bench.name}/sync", _time, bench, "sync", 1, inner_loops=bench.ops
+        )
+        for impl in IMPLS[1:]:
+            for tasks in concurrency:
+                runner.bench_time_func(
+                    f"{bench.name}/{impl}/c{tasks}",
+                    _time,
+                    bench,
+                    impl,
+                    tasks,
+                    inner_loops=tasks * bench.ops,
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measure the per-call overhead of delegated file methods.
+
+Two numbers are reported per method:
+
+- dispatch: the time spent on the event loop to issue a call, from calling
+  the method until it waits for the executor. This is aiofiles' own
+  per-call overhead.
+- burst: the time per call of bursts of calls awaited with `asyncio.gather`,
+  which share executor jobs. This includes asyncio's task machinery.
+
+Run with `python benchmarks/bench_delegation.py`.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import Executor, Future
+from functools import partial
+
+import aiofiles
+
+
+class _DeferredExecutor(Executor):
+    """An executor running jobs only when asked to, in the calling thread."""
+
+    def __init__(self):
+        self._jobs = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        self._jobs.append((future, partial(fn, *args, **kwargs)))
+        return future
+
+    def run_jobs(self):
+        while self._jobs:
+            future, fn = self._jobs.pop(0)
+            if future.set_running_or_notify_cancel():
+                future.set_result(fn())
+
+
+async def _dispatch(make_call, calls, file):
+    # Defer running the calls, so worker threads don't compete for the GIL.
+    executor = file._executor = _DeferredExecutor()
+    start = time.perf_counter()
+    for _ in range(calls):
+        coro = make_call()
+        coro.send(None)  # Runs until the call waits for the executor.
+        coro.close()
+    elapsed = time.perf_counter() - start
+    executor.run_jobs()
+    file._executor = None
+    await asyncio.sleep(0)
+    return elapsed / calls
+
+
+async def _burst(make_call, calls, burst):
+    start = time.perf_counter()
+    for _ in range(calls // burst):
+        await asyncio.gather(*(make_call() for _ in range(burst)))
+    return (time.perf_counter() - start) / calls
+
+
+async def bench(path, calls, burst, repeat):
+    results = {}
+    async with aiofiles.open(path, "rb") as f:
+        calls_by_name = {
+            "tell": f.tell,
+            "read(1)": lambda: f.read(1),
+            "seek(0)": lambda: f.seek(0),
+        }
+        for name, make_call in calls_by_name.items():
+            results[name] = (
+                min([await _dispatch(make_call, calls, f) for _ in range(repeat)]),
+                min([await _burst(make_call, calls, burst) for _ in range(repeat)]),
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--burst", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "data")
+        with open(path, "wb") as f:
+            f.write(os.urandom(4 * args.calls * args.repeat))
+        results = asyncio.run(bench(path, args.calls, args.burst, args.repeat))
+
+    print(f"{'method':<10} {'dispatch':>14} {'burst':>14}")
+    for name, (dispatch, burst) in results.items():
+        print(f"{name:<10} {dispatch * 1e6:9.3f} us/op {burst * 1e6:9.3f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,40 @@
 """Utilities for asyncio-friendly file handling."""
 
 from . import tempfile
+from .atomic import atomic_write
+from .buffers import BufferPool
+from .groupcommit import GroupCommit
+from .mmap import mmap_open
+from .parallel import read_parallel
 from .threadpool import (
     open,
+    read_bytes,
+    read_text,
     stderr,
     stderr_bytes,
     stdin,
     stdin_bytes,
     stdout,
     stdout_bytes,
+    write_bytes,
+    write_text,
 )
+from .transfer import copyfile, send_to_transport
 
 __all__ = [
+    "BufferPool",
+    "GroupCommit",
+    "atomic_write",
+    "copyfile",
+    "mmap_open",
     "open",
+    "read_bytes",
+    "read_parallel",
+    "read_text",
+    "send_to_transport",
     "tempfile",
+    "write_bytes",
+    "write_text",
     "stdin",
     "stdout",
     "stderr",
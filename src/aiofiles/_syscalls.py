@@ -0,0 +1,50 @@
+"""Bindings for system calls the `os` module lacks.
+
+The C library is only loaded when a binding is first called, so importing
+aiofiles doesn't pull in `ctypes`.
+"""
+
+import errno
+import os
+import sys
+from typing import Callable, Optional
+
+SYNC_FILE_RANGE_WAIT_BEFORE = 1
+SYNC_FILE_RANGE_WRITE = 2
+SYNC_FILE_RANGE_WAIT_AFTER = 4
+
+# The C functions, bound on first use.
+_functions: dict[str, Optional[Callable]] = {}
+
+
+def _load_sync_file_range():
+    import ctypes  # noqa: PLC0415
+
+    try:
+        func = ctypes.CDLL(None, use_errno=True).sync_file_range
+    except (AttributeError, OSError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_int64, ctypes.c_int64, ctypes.c_uint]
+    func.restype = ctypes.c_int
+
+    def sync_file_range(fd, offset, nbytes, flags):
+        if func(fd, offset, nbytes, flags) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    return sync_file_range
+
+
+def _sync_file_range(fd, offset, nbytes, flags):
+    """Sync a range of a file, like sync_file_range(2) on Linux."""
+    try:
+        func = _functions["sync_file_range"]
+    except KeyError:
+        func = _functions["sync_file_range"] = _load_sync_file_range()
+    if func is None:
+        raise OSError(errno.ENOSYS, os.strerror(errno.ENOSYS))
+    func(fd, offset, nbytes, flags)
+
+
+# Only looked up in the C library once called, raising ENOSYS if missing.
+sync_file_range = _sync_file_range if sys.platform == "linux" else None
@@ -0,0 +1,190 @@
+"""Replace files atomically and durably."""
+
+import asyncio
+import os
+import secrets
+import weakref
+from contextlib import asynccontextmanager, suppress
+from functools import partial
+from tempfile import TMP_MAX
+from typing import Union
+
+from .executor import run_in_executor
+from .threadpool import wrap
+from .threadpool.utils import submit
+
+__all__ = ["atomic_write"]
+
+# Directory syncs per loop, by directory.
+_dir_syncs: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Union[str, bytes], "_DirSync"]
+] = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def atomic_write(
+    file,
+    mode="w",
+    buffering=-1,
+    encoding=None,
+    errors=None,
+    newline=None,
+    *,
+    batch_dir_sync=False,
+    loop=None,
+    executor=None,
+):
+    """Write a file so it's replaced atomically, and durably, on success.
+
+    Data is written to a temporary file next to `file`. When the block exits
+    without an exception, the temporary file is flushed and synced, renamed
+    over `file`, and the directory is synced so the rename persists, all in a
+    single executor job. Otherwise, the temporary file is removed and `file`
+    is left untouched.
+
+    With `batch_dir_sync`, the directory sync is done separately, and shared
+    by all concurrent atomic writes in the same directory that also use it.
+    """
+    if not mode.startswith("w"):
+        msg = f"Invalid mode: {mode!r}, atomic writes need a 'w' mode."
+        raise ValueError(msg)
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    file = os.fsdecode(file)
+    directory = os.path.dirname(file) or os.curdir
+
+    cb = partial(_open_temp, file, mode, buffering, encoding, errors, newline)
+    temp_name, f = await run_in_executor(loop, executor, cb)
+    async_file = wrap(f, loop=loop, executor=executor)
+    try:
+        yield async_file
+    except BaseException:
+        await submit(async_file, partial(_discard, f, temp_name))
+        raise
+
+    # Taken by whichever of the commit and the discard below runs.
+    token = [None]
+    cb = partial(
+        _commit, token, f, temp_name, file, None if batch_dir_sync else directory
+    )
+    try:
+        await submit(async_file, cb)
+    except BaseException:
+        # Cancelled before the commit ran, which cleans up after itself.
+        if _take(token):
+            cb = partial(_discard, f, temp_name)
+            await asyncio.shield(submit(async_file, cb))
+        raise
+    if batch_dir_sync:
+        await _sync_dir_batched(directory, loop, executor)
+
+
+def _open_temp(file, mode, buffering, encoding, errors, newline):
+    directory, name = os.path.split(file)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(TMP_MAX):
+        temp_name = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            # Unlike mkstemp, this gives the file the usual permissions.
+            fd = os.open(temp_name, flags, 0o666)
+        except FileExistsError:
+            continue
+        try:
+            return temp_name, open(fd, mode, buffering, encoding, errors, newline)
+        except BaseException:
+            os.close(fd)
+            os.unlink(temp_name)
+            raise
+    msg = f"No usable temporary file name found next to {file!r}"
+    raise FileExistsError(msg)
+
+
+def _discard(f, temp_name):
+    try:
+        f.close()
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_name)
+
+
+def _take(token):
+    """Take `token`, returning whether it was still there."""
+    try:
+        token.pop()
+    except IndexError:
+        return False
+    return True
+
+
+def _commit(token, f, temp_name, file, directory):
+    if not _take(token):
+        return
+    try:
+        with f:
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_name, file)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+    if directory is not None:
+        _sync_dir(directory)
+
+
+def _sync_dir(directory):
+    if os.name == "nt":
+        # Directories can't be opened, or synced, on Windows.
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _DirSync:
+    """Syncs of a directory, one at a time, each shared by all its waiters."""
+
+    __slots__ = ("next", "running")
+
+    def __init__(self):
+        self.running = None
+        self.next = None
+
+
+async def _sync_dir_batched(directory, loop, executor):
+    syncs = _dir_syncs.setdefault(loop, {})
+    state = syncs.get(directory)
+    if state is None:
+        state = syncs[directory] = _DirSync()
+    waiters = state.next
+    if waiters is None:
+        # A sync already running may have started before our rename, so
+        # wait for the next one.
+        waiters = state.next = loop.create_future()
+        if state.running is None:
+            _start_dir_sync(syncs, directory, state, loop, executor)
+    await asyncio.shield(waiters)
+
+
+def _start_dir_sync(syncs, directory, state, loop, executor):
+    waiters = state.next
+    state.next = None
+    state.running = run_in_executor(loop, executor, partial(_sync_dir, directory))
+
+    def done(job):
+        state.running = None
+        if not waiters.done():
+            if job.cancelled():
+                waiters.cancel()
+            elif job.exception() is not None:
+                waiters.set_exception(job.exception())
+            else:
+                waiters.set_result(None)
+        if state.next is not None:
+            _start_dir_sync(syncs, directory, state, loop, executor)
+        else:
+            del syncs[directory]
+
+    state.running.add_done_callback(done)
@@ -1,8 +1,16 @@
-from asyncio import get_running_loop
+import threading
+from asyncio import gather, get_running_loop
+from collections import deque
 from collections.abc import Awaitable
 from contextlib import AbstractAsyncContextManager
 from functools import partial, wraps
 
+from .executor import Batcher, run_in_executor
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_MANY_CONCURRENCY = 4
+DEFAULT_MANY_CHUNK_SIZE = 256
+
 
 def wrap(func):
     @wraps(func)
@@ -10,21 +18,131 @@ def wrap(func):
         if loop is None:
             loop = get_running_loop()
         pfunc = partial(func, *args, **kwargs)
-        return await loop.run_in_executor(executor, pfunc)
+        return await run_in_executor(loop, executor, pfunc)
 
     return run
 
 
+def wrap_many(func):
+    """Make a coroutine function applying `func` to many items.
+
+    The items are split into chunks of `chunk_size`, which are processed by
+    up to `concurrency` executor jobs. Results are returned in order, with
+    the `OSError` raised for an item, if any, in place of its result.
+    """
+
+    async def run(
+        items,
+        *,
+        concurrency=DEFAULT_MANY_CONCURRENCY,
+        chunk_size=DEFAULT_MANY_CHUNK_SIZE,
+        loop=None,
+        executor=None,
+        **kwargs,
+    ):
+        if concurrency <= 0 or chunk_size <= 0:
+            msg = "concurrency and chunk_size must be greater than 0"
+            raise ValueError(msg)
+        if loop is None:
+            loop = get_running_loop()
+        items = list(items)
+        results = [None] * len(items)
+        chunks = deque(range(0, len(items), chunk_size))
+        stop = threading.Event()
+        cb = partial(
+            _apply_chunks,
+            partial(func, **kwargs),
+            items,
+            results,
+            chunks,
+            chunk_size,
+            stop,
+        )
+        jobs = [
+            run_in_executor(loop, executor, cb, run.__name__)
+            for _ in range(min(concurrency, len(chunks)))
+        ]
+        try:
+            await gather(*jobs)
+        finally:
+            # On cancellation, have the jobs stop early.
+            stop.set()
+        return results
+
+    run.__name__ = run.__qualname__ = f"{func.__name__}_many"
+    run.__doc__ = f"Apply `{func.__name__}` to many items, see `wrap_many`."
+    return run
+
+
+def _apply_chunks(func, items, results, chunks, chunk_size, stop):
+    while not stop.is_set():
+        try:
+            start = chunks.popleft()
+        except IndexError:
+            return
+        for index in range(start, min(start + chunk_size, len(items))):
+            try:
+                results[index] = func(items[index])
+            except OSError as exc:
+                results[index] = exc
+
+
+def _bind_methods(file, names):
+    """Return the methods `names` of `file` it has, bound once for reuse."""
+    methods = {}
+    for name in names:
+        method = getattr(file, name, None)
+        if method is not None:
+            methods[name] = method
+    return methods
+
+
 class AsyncBase:
+    __slots__ = (
+        "__weakref__",
+        "_batcher",
+        "_bound",
+        # Set on named temporary files.
+        "_closer",
+        "delete",
+        "_executor",
+        "_file",
+        "_read_ahead",
+        "_ref_loop",
+        "_write_behind",
+    )
+
+    # The methods run on the executor, set by `delegate_to_executor`.
+    _delegated = ()
+
     def __init__(self, file, loop, executor):
         self._file = file
         self._executor = executor
         self._ref_loop = loop
+        self._batcher = None
+        # Indirect files have no file yet, and look their methods up per call.
+        self._bound = _bind_methods(file, self._delegated)
+        # Set by the read-ahead and write-behind modes of binary files, and
+        # checked before every call.
+        self._read_ahead = None
+        self._write_behind = None
 
     @property
     def _loop(self):
         return self._ref_loop or get_running_loop()
 
+    def enable_ordering(self):
+        """Run calls on this file one at a time, in the order they're made.
+
+        By default, calls made while an earlier one is running may run
+        alongside it, which concurrently issued calls (for example with
+        `asyncio.gather`) that depend on each other's effects can't have.
+        Don't use this on pipes or terminals read and written at once: a
+        blocked read then holds back every later call, including the write
+        the other end is waiting for.
+        """
+        _ordered_batcher(self)
+
     def __aiter__(self):
         """We are our own iterator."""
         return self
@@ -39,8 +157,32 @@ class AsyncBase:
             return line
         raise StopAsyncIteration
 
+    async def iter_lines(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Iterate over lines, fetching about `chunk_size` of them at a time.
+
+        Normal iteration costs a trip to the executor per line. This reads
+        whole lines totalling roughly `chunk_size` bytes (or characters) per
+        trip instead, and hands them out from memory. The file position is
+        after the last line fetched, which may be ahead of the last line
+        handed out.
+        """
+        while lines := await self.readlines(chunk_size):
+            for line in lines:
+                yield line
+
+
+def _ordered_batcher(obj):
+    """Return the batcher of `obj`, made to keep its calls in order."""
+    batcher = obj._batcher
+    if batcher is None:
+        batcher = obj._batcher = Batcher(ordered=True)
+    batcher.ordered = True
+    return batcher
+
 
 class AsyncIndirectBase(AsyncBase):
+    __slots__ = ("_indirect", "_name")
+
     def __init__(self, name, loop, executor, indirect):
         self._indirect = indirect
         self._name = name
@@ -73,7 +215,14 @@ class AiofilesContextManager(Awaitable, AbstractAsyncContextManager):
         return await self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await get_running_loop().run_in_executor(
-            None, self._obj._file.__exit__, exc_type, exc_val, exc_tb
-        )
+        obj = self._obj
+        write_behind = getattr(obj, "_write_behind", None)
+        if write_behind is not None:
+            write_behind.submit_buffer()
+        cb = partial(obj._file.__exit__, exc_type, exc_val, exc_tb)
+        if obj._batcher is None:
+            obj._batcher = Batcher()
+        await obj._batcher.submit(obj._loop, obj._executor, cb, "close")
         self._obj = None
+        if write_behind is not None:
+            write_behind.raise_error()
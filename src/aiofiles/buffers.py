@@ -0,0 +1,82 @@
+"""Reusable buffers for reading without allocating."""
+
+import asyncio
+from collections import deque
+
+__all__ = ["DEFAULT_BUFFER_SIZE", "BufferPool"]
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class BufferPool:
+    """A bounded pool of fixed-size `bytearray` buffers.
+
+    Buffers are allocated lazily, up to `count` of them. `acquire()` waits
+    for a buffer to be released once they are all in use, which also bounds
+    how much data a reader can have in flight. The pool is meant to be used
+    from a single event loop.
+    """
+
+    def __init__(self, buffer_size=DEFAULT_BUFFER_SIZE, count=8):
+        if buffer_size <= 0:
+            msg = "buffer_size must be greater than 0"
+            raise ValueError(msg)
+        if count <= 0:
+            msg = "count must be greater than 0"
+            raise ValueError(msg)
+        self._buffer_size = buffer_size
+        self._count = count
+        self._buffers = {}  # By id, to recognize them when released.
+        self._free = []
+        self._waiters = deque()
+
+    @property
+    def buffer_size(self):
+        return self._buffer_size
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def available(self):
+        """The number of buffers that can be acquired without waiting."""
+        return len(self._free) + self._count - len(self._buffers)
+
+    async def acquire(self):
+        """Get a buffer, waiting for one to be released if necessary."""
+        if self._free:
+            return self._free.pop()
+        if len(self._buffers) < self._count:
+            buffer = bytearray(self._buffer_size)
+            self._buffers[id(buffer)] = buffer
+            return buffer
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # We were handed a buffer just as we got cancelled.
+                self.release(waiter.result())
+            raise
+
+    def release(self, buffer):
+        """Give back a buffer, or a memoryview of one.
+
+        The buffer may be handed out again right away, so any views of it
+        must not be used afterwards.
+        """
+        if isinstance(buffer, memoryview):
+            buffer = buffer.obj
+        if self._buffers.get(id(buffer)) is not buffer or any(
+            b is buffer for b in self._free
+        ):
+            msg = "Buffer not acquired from this pool."
+            raise ValueError(msg)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(buffer)
+                return
+        self._free.append(buffer)
@@ -0,0 +1,139 @@
+"""A cache of file contents, for small files read over and over."""
+
+import asyncio
+import os
+from collections import OrderedDict
+from functools import partial
+from io import BytesIO, FileIO, TextIOWrapper
+
+from .executor import run_in_executor
+from .statcache import CacheInfo
+
+__all__ = ["DEFAULT_MAX_SIZE", "CacheInfo", "FileCache"]
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+
+class FileCache:
+    """A cache of file contents, holding at most `maxsize` bytes.
+
+    Every lookup takes a single executor job, which checks the cached copy
+    is still current by comparing the modification time, size and inode of
+    the file, and reads the file again otherwise. Concurrent lookups of the
+    same path share a single job. Every lookup counts as a hit if served
+    from the cached copy, and as a miss if the file was read, even when
+    sharing a read with other lookups. The least recently used files are
+    evicted first, and files larger than `maxsize` aren't cached at all.
+    A cache isn't thread-safe, and should be used from a single event loop.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAX_SIZE, *, executor=None):
+        if maxsize <= 0:
+            msg = "maxsize must be greater than 0"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._executor = executor
+        self._entries = OrderedDict()
+        self._size = 0
+        self._pending = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def info(self):
+        """Return the hit and miss counters, and the sizes in bytes."""
+        return CacheInfo(self._hits, self._misses, self._maxsize, self._size)
+
+    def invalidate(self, path):
+        """Forget the contents of `path`."""
+        entry = self._entries.pop(os.fspath(path), None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def clear(self):
+        """Forget all contents and reset the counters."""
+        self._entries.clear()
+        self._size = 0
+        self._hits = self._misses = 0
+
+    async def read_bytes(self, path, *, loop=None, executor=None):
+        """Return the contents of `path` as bytes."""
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        if executor is None:
+            executor = self._executor
+        path = os.fspath(path)
+
+        job = self._pending.get(path)
+        if job is None or job.get_loop() is not loop:
+            entry = self._entries.get(path)
+            cb = partial(_read_if_changed, path, entry and entry[0])
+            job = run_in_executor(loop, executor, cb)
+            self._pending[path] = job
+            job.add_done_callback(partial(self._store, path))
+        # Other callers may be waiting for the same job.
+        signature, data = await asyncio.shield(job)
+
+        if data is None:
+            # The cached copy is current, but may have been evicted since.
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._hits += 1
+                return entry[1]
+            return await self.read_bytes(path, loop=loop, executor=executor)
+        self._misses += 1
+        return data
+
+    async def read_text(
+        self,
+        path,
+        encoding=None,
+        errors=None,
+        newline=None,
+        *,
+        loop=None,
+        executor=None,
+    ):
+        """Return the contents of `path` decoded, like a file opened with `"r"`."""
+        data = await self.read_bytes(path, loop=loop, executor=executor)
+        with TextIOWrapper(BytesIO(data), encoding, errors, newline) as f:
+            return f.read()
+
+    def _store(self, path, job):
+        if self._pending.get(path) is job:
+            del self._pending[path]
+        if job.cancelled() or job.exception() is not None:
+            self.invalidate(path)
+            return
+        signature, data = job.result()
+        if data is None:
+            if path in self._entries:
+                self._entries.move_to_end(path)
+            return
+        self.invalidate(path)
+        if len(data) > self._maxsize:
+            return
+        self._entries[path] = (signature, data)
+        self._size += len(data)
+        while self._size > self._maxsize:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+def _signature(st):
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_if_changed(path, signature):
+    """Read the file unless it still matches `signature`."""
+    if signature is not None:
+        current = _signature(os.stat(path))
+        if current == signature:
+            return current, None
+    with FileIO(path) as f:
+        # Take the signature of the file actually read.
+        signature = _signature(os.fstat(f.fileno()))
+        return signature, f.readall()
@@ -0,0 +1,229 @@
+"""The thread pool aiofiles uses for blocking file operations.
+
+Unless an explicit `executor` is passed, aiofiles runs file I/O on a thread
+pool of its own instead of the event loop's default executor, so file
+operations don't compete with other blocking work (DNS lookups, for example).
+There is one pool per event loop, created lazily and shut down when the loop
+is garbage collected or when `shutdown()` is awaited.
+"""
+
+import os
+import threading
+import weakref
+from asyncio import AbstractEventLoop, get_running_loop
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+
+from .metrics import _hooks, _Job
+
+__all__ = [
+    "Batcher",
+    "DEFAULT_MAX_WORKERS",
+    "THREAD_NAME_PREFIX",
+    "get_executor",
+    "get_max_workers",
+    "run_in_executor",
+    "set_max_workers",
+    "shutdown",
+]
+
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+THREAD_NAME_PREFIX = "aiofiles"
+
+_settings = {"max_workers": DEFAULT_MAX_WORKERS}
+_executors: weakref.WeakKeyDictionary[AbstractEventLoop, ThreadPoolExecutor] = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def get_max_workers():
+    """Return the size used for newly created file I/O pools."""
+    return _settings["max_workers"]
+
+
+def set_max_workers(max_workers=None):
+    """Set the size of file I/O pools created from now on.
+
+    Pools that already exist keep their size; await `shutdown()` to have the
+    next operation on that loop create a pool with the new size. Passing
+    `None` restores the default.
+    """
+    if max_workers is None:
+        max_workers = DEFAULT_MAX_WORKERS
+    elif max_workers <= 0:
+        msg = "max_workers must be greater than 0"
+        raise ValueError(msg)
+    _settings["max_workers"] = max_workers
+
+
+def get_executor(loop=None):
+    """Return the file I/O pool for `loop`, creating it if necessary."""
+    if loop is None:
+        loop = get_running_loop()
+    executor = _executors.get(loop)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(loop)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    _settings["max_workers"], thread_name_prefix=THREAD_NAME_PREFIX
+                )
+                _executors[loop] = executor
+                weakref.finalize(loop, executor.shutdown, wait=False)
+    return executor
+
+
+def run_in_executor(loop, executor, func, name=None):
+    """Run `func` on `executor`, or on the file I/O pool of `loop` if `None`.
+
+    The operation is reported to metrics hooks as `name`, by default the name
+    of `func`.
+    """
+    if _hooks:
+        if executor is None:
+            executor = get_executor(loop)
+        job = _Job(loop, executor, func, name)
+        future = _run_in_executor(loop, executor, job)
+        future.add_done_callback(job.future_done)
+        return future
+    return _run_in_executor(loop, executor, func)
+
+
+def _run_in_executor(loop, executor, func):
+    if executor is None:
+        executor = get_executor(loop)
+    return loop.run_in_executor(executor, func)
+
+
+async def shutdown(loop=None):
+    """Shut down the file I/O pool of `loop`, waiting for pending jobs.
+
+    This mirrors `loop.shutdown_default_executor()`: the pool is joined in a
+    separate thread so the loop isn't blocked. Later operations on the loop
+    will transparently create a new pool.
+    """
+    if loop is None:
+        loop = get_running_loop()
+    with _lock:
+        executor = _executors.pop(loop, None)
+    if executor is None:
+        return
+    future = loop.create_future()
+
+    def _do_shutdown():
+        try:
+            executor.shutdown(wait=True)
+        finally:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(future.set_result, None)
+
+    thread = threading.Thread(target=_do_shutdown, name=f"{THREAD_NAME_PREFIX}-stop")
+    thread.start()
+    try:
+        await future
+    finally:
+        thread.join()
+
+
+class Batcher:
+    """Run calls on one file several per executor job.
+
+    Calls submitted while a job is queued and hasn't started yet are picked
+    up by that job instead of getting one of their own, so a burst of calls
+    costs a single thread hop. Calls submitted once it's running get a new
+    job, which may run alongside it: a call blocking until the other end of
+    a pipe or terminal acts doesn't hold back the calls that would make it
+    act. With `ordered`, calls instead wait for the running job, so they
+    all run one at a time in the order they were submitted. Results are
+    handed back to the waiting coroutines in one go per batch. Calls whose
+    future was cancelled before they started are skipped, like with
+    `loop.run_in_executor`.
+    """
+
+    __slots__ = ("_lock", "_queue", "_running", "_scheduled", "ordered")
+
+    def __init__(self, ordered=False):
+        self._lock = threading.Lock()
+        self._queue = deque()
+        # Whether a job is queued, and the number of jobs running.
+        self._scheduled = False
+        self._running = 0
+        self.ordered = ordered
+
+    @property
+    def busy(self):
+        """Whether calls are queued or running."""
+        return self._scheduled or self._running > 0
+
+    def submit(self, loop, executor, func, name=None):
+        """Queue `func`, returning a future for its result.
+
+        The call is reported to metrics hooks as `name`, by default the name
+        of `func`.
+        """
+        future = loop.create_future()
+        if _hooks:
+            func = _Job(loop, executor or get_executor(loop), func, name)
+            future.add_done_callback(func.future_done)
+        with self._lock:
+            self._queue.append((func, future))
+            if self._scheduled or (self.ordered and self._running):
+                return future
+            self._scheduled = True
+        try:
+            _run_in_executor(loop, executor, self._drain)
+        except BaseException:
+            with self._lock:
+                batch = list(self._queue)
+                self._queue.clear()
+                self._scheduled = False
+            for _, queued in batch:
+                queued.cancel()
+            raise
+        return future
+
+    def _drain(self):
+        with self._lock:
+            self._scheduled = False
+            self._running += 1
+            batch = list(self._queue)
+            self._queue.clear()
+        while True:
+            _run_batch(batch)
+            with self._lock:
+                # Unless ordered, calls queued meanwhile have a job of their
+                # own. Ordered calls wait for the last running job.
+                if not self._queue or self._scheduled or self._running > 1:
+                    self._running -= 1
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+
+
+def _run_batch(batch):
+    results = {}
+    for func, future in batch:
+        if future.cancelled():
+            continue
+        try:
+            outcome = (future, func(), None)
+        except BaseException as exc:  # noqa: BLE001
+            outcome = (future, None, exc)
+        results.setdefault(future.get_loop(), []).append(outcome)
+    for loop, outcomes in results.items():
+        # If the loop is closed, nobody is waiting anymore.
+        with suppress(RuntimeError):
+            loop.call_soon_threadsafe(partial(_deliver, outcomes))
+
+
+def _deliver(outcomes):
+    for future, result, exc in outcomes:
+        if future.cancelled():
+            continue
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
@@ -0,0 +1,97 @@
+"""Share file syncs between concurrent writers."""
+
+import asyncio
+import os
+from functools import partial
+
+from .threadpool.utils import submit
+
+__all__ = ["GroupCommit"]
+
+
+class GroupCommit:
+    """Make writes to an async file durable, sharing syncs between callers.
+
+    Every `await sync()` returns once everything written to the file before
+    the call is on disk. Callers arriving while a sync is running wait for the
+    next one, which is shared by all of them, so there is at most one sync in
+    flight for the file. The next sync starts once `max_delay` seconds have
+    passed since its first caller arrived, or as soon as `max_batch` callers
+    are waiting for it.
+
+    With `datasync` (the default), `os.fdatasync` is used where available,
+    skipping metadata not needed to read the data back.
+    """
+
+    def __init__(self, file, *, max_delay=0.0, max_batch=None, datasync=True):
+        if max_delay < 0:
+            msg = "max_delay must not be negative"
+            raise ValueError(msg)
+        if max_batch is not None and max_batch <= 0:
+            msg = "max_batch must be greater than 0"
+            raise ValueError(msg)
+        self._file = file
+        self._max_delay = max_delay
+        self._max_batch = max_batch
+        if datasync and hasattr(os, "fdatasync"):
+            self._sync = os.fdatasync
+        else:
+            self._sync = os.fsync
+        self._running = False
+        self._next = None  # The future of the next sync, once requested.
+        self._next_size = 0
+        self._next_ready = False
+        self._timer = None
+
+    async def sync(self):
+        """Wait until everything written to the file so far is on disk."""
+        if self._next is None:
+            loop = self._file._loop
+            self._next = loop.create_future()
+            self._next_size = 0
+            self._next_ready = not self._max_delay
+            if self._max_delay:
+                self._timer = loop.call_later(self._max_delay, self._delay_elapsed)
+        waiters = self._next
+        self._next_size += 1
+        if self._max_batch is not None and self._next_size >= self._max_batch:
+            self._next_ready = True
+        self._maybe_start()
+        # Other callers are waiting for the same sync.
+        await asyncio.shield(waiters)
+
+    def _delay_elapsed(self):
+        self._timer = None
+        self._next_ready = True
+        self._maybe_start()
+
+    def _maybe_start(self):
+        if self._running or not self._next_ready:
+            return
+        waiters = self._next
+        self._next = None
+        self._next_ready = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._running = True
+        cb = partial(_flush_and_sync, self._file._file, self._sync)
+        job = submit(self._file, cb, self._sync.__name__)
+        job.add_done_callback(partial(self._done, waiters))
+
+    def _done(self, waiters, job):
+        self._running = False
+        if not waiters.done():
+            if job.cancelled():
+                waiters.cancel()
+            elif job.exception() is not None:
+                waiters.set_exception(job.exception())
+            else:
+                waiters.set_result(None)
+        if self._next is not None:
+            self._maybe_start()
+
+
+def _flush_and_sync(file, sync):
+    file.flush()
+    sync(file.fileno())
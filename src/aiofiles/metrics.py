@@ -0,0 +1,292 @@
+"""Instrumentation of the operations aiofiles runs on its executors.
+
+Hooks added with `add_hook` are told about every operation aiofiles runs on
+an executor: file object methods, `aiofiles.os` functions, opening files and
+so on. A hook is called with an `Operation` on the event loop, in the context
+of the task submitting it, and may return a callable which is called with the
+same `Operation` once it's finished. This maps onto tracing spans, started by
+the hook and ended by the callable, like with OpenTelemetry:
+
+    def trace(operation):
+        span = tracer.start_span(f"aiofiles.{operation.name}")
+
+        def end(operation):
+            if operation.error is not None:
+                span.record_exception(operation.error)
+            span.set_attribute("aiofiles.bytes", operation.nbytes)
+            span.end()
+
+        return end
+
+    aiofiles.metrics.add_hook(trace)
+
+Finished callables run in the executor thread, so they should be quick. If
+they raise, the exception goes to the loop's exception handler.
+
+`enable_metrics` installs a hook keeping counters per operation name, read
+with `metrics_snapshot`. With no hooks, operations aren't instrumented.
+"""
+
+import os
+import threading
+import time
+from asyncio import CancelledError
+from contextlib import suppress
+from functools import partial
+from types import ModuleType
+from typing import Callable, NamedTuple, Optional
+
+__all__ = [
+    "Operation",
+    "OperationStats",
+    "add_hook",
+    "disable_metrics",
+    "enable_metrics",
+    "metrics_snapshot",
+    "remove_hook",
+    "reset_metrics",
+]
+
+_hooks: list[Callable[["Operation"], Optional[Callable[["Operation"], None]]]] = []
+
+# Operations whose result is the data read, and whose result is the size of
+# the data transferred.
+_READS = frozenset({"pread", "read", "read1", "readline"})
+_COUNTS = frozenset(
+    {
+        "copy_file_range",
+        "preadinto",
+        "pwrite",
+        "readinto",
+        "readinto1",
+        "sendfile",
+        "write",
+    }
+)
+
+
+class Operation:
+    """An operation run on an executor.
+
+    `executor` is the executor it runs on, and `path` the path of the file
+    it operates on, if known. Times are `time.perf_counter()` values:
+    `queued` when the operation was submitted, `started` and `ended` when it
+    started and finished running. `started` stays `None` for operations
+    cancelled before they started, which get a `CancelledError` as their
+    `error`.
+    """
+
+    __slots__ = (
+        "_func",
+        "ended",
+        "error",
+        "executor",
+        "name",
+        "nbytes",
+        "queued",
+        "started",
+    )
+
+    def __init__(self, func, name, executor):
+        self._func = func
+        self.name = name
+        self.executor = executor
+        self.queued = time.perf_counter()
+        self.started = None
+        self.ended = None
+        self.nbytes = 0
+        self.error = None
+
+    @property
+    def path(self):
+        """The path of the file operated on, or `None` if unknown."""
+        return _path_of(self._func)
+
+    @property
+    def queue_wait(self):
+        """The seconds spent waiting for an executor thread."""
+        start = self.started if self.started is not None else self.ended
+        if start is None:
+            return time.perf_counter() - self.queued
+        return start - self.queued
+
+    @property
+    def execution(self):
+        """The seconds spent running."""
+        if self.started is None:
+            return 0.0
+        end = self.ended if self.ended is not None else time.perf_counter()
+        return end - self.started
+
+    def __repr__(self):
+        return f"<Operation {self.name}>"
+
+
+class OperationStats(NamedTuple):
+    calls: int
+    errors: int
+    nbytes: int
+    queue_wait: float
+    execution: float
+
+
+def add_hook(hook):
+    """Call `hook` with every `Operation` submitted to an executor."""
+    _hooks.append(hook)
+
+
+def remove_hook(hook):
+    """Stop calling `hook`."""
+    _hooks.remove(hook)
+
+
+class _Counters:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __call__(self, operation):
+        return self._record
+
+    def _record(self, operation):
+        with self._lock:
+            stats = self._stats.get(operation.name)
+            if stats is None:
+                stats = self._stats[operation.name] = [0, 0, 0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += operation.error is not None
+            stats[2] += operation.nbytes
+            stats[3] += operation.queue_wait
+            stats[4] += operation.execution
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: OperationStats(*stats)
+                for name, stats in sorted(self._stats.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+_counters = _Counters()
+
+
+def enable_metrics():
+    """Start counting operations, their bytes, errors and times by name."""
+    if _counters not in _hooks:
+        add_hook(_counters)
+
+
+def disable_metrics():
+    """Stop counting operations, keeping the counts so far."""
+    if _counters in _hooks:
+        remove_hook(_counters)
+
+
+def metrics_snapshot():
+    """Return the `OperationStats` of every operation name counted so far.
+
+    Times are totals, in seconds.
+    """
+    return _counters.snapshot()
+
+
+def reset_metrics():
+    """Zero the counters."""
+    _counters.reset()
+
+
+class _Job:
+    """Run a function as an instrumented operation."""
+
+    __slots__ = ("_finished", "_func", "_loop", "operation")
+
+    def __init__(self, loop, executor, func, name):
+        self._loop = loop
+        self._func = func
+        self.operation = operation = Operation(func, name or _name_of(func), executor)
+        finished = []
+        for hook in tuple(_hooks):
+            callback = hook(operation)
+            if callback is not None:
+                finished.append(callback)
+        # Popped by whoever finishes the operation, as that can be either the
+        # executor thread or the loop on cancellation.
+        self._finished = [finished]
+
+    def __call__(self):
+        operation = self.operation
+        operation.started = time.perf_counter()
+        try:
+            result = self._func()
+        except BaseException as exc:
+            operation.error = exc
+            raise
+        else:
+            operation.nbytes = _nbytes(operation.name, result)
+            return result
+        finally:
+            operation.ended = time.perf_counter()
+            self._finish()
+
+    def future_done(self, future):
+        """Report the operation if its future was cancelled before it started."""
+        if future.cancelled() and self.operation.started is None:
+            self.operation.error = CancelledError()
+            self.operation.ended = time.perf_counter()
+            self._finish()
+
+    def _finish(self):
+        try:
+            finished = self._finished.pop()
+        except IndexError:
+            return
+        for callback in finished:
+            try:
+                callback(self.operation)
+            except Exception as exc:  # noqa: BLE001
+                context = {
+                    "message": "Exception in aiofiles metrics hook",
+                    "exception": exc,
+                    "operation": self.operation,
+                }
+                # If the loop is closed, there's nobody left to tell.
+                with suppress(RuntimeError):
+                    self._loop.call_soon_threadsafe(
+                        self._loop.call_exception_handler, context
+                    )
+
+
+def _name_of(func):
+    while isinstance(func, partial):
+        func = func.func
+    return getattr(func, "__name__", type(func).__name__).strip("_")
+
+
+def _path_of(func):
+    args = ()
+    if isinstance(func, partial):
+        # Nested partials are flattened.
+        args = func.args
+        func = func.func
+    # The file of file methods, or the file or path the function is given.
+    target = getattr(func, "__self__", None)
+    if target is None or isinstance(target, ModuleType):
+        target = args[0] if args else None
+    if isinstance(target, (str, bytes, os.PathLike)):
+        return os.fspath(target)
+    name = getattr(target, "name", None)
+    if isinstance(name, (str, bytes)):
+        return name
+    return None
+
+
+def _nbytes(name, result):
+    if name in _READS and isinstance(result, (bytes, bytearray, str)):
+        return len(result)
+    if name in _COUNTS and isinstance(result, int):
+        return result
+    return 0
@@ -0,0 +1,100 @@
+"""Async memory-mapped files."""
+
+import asyncio
+import mmap
+from functools import partial
+from io import FileIO
+
+from .base import AiofilesContextManager, _bind_methods
+from .executor import run_in_executor
+from .threadpool.utils import (
+    delegate_to_executor,
+    proxy_method_directly,
+    proxy_property_directly,
+)
+
+__all__ = ["AsyncMmapFile", "mmap_open"]
+
+_ACCESS_MODES = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+
+def mmap_open(file, mode="r", *, loop=None, executor=None):
+    """Map a whole file into memory.
+
+    `mode` is `"r"` for read-only, `"r+"` for writes going to the file, or
+    `"c"` for copy-on-write, where writes stay in memory.
+    """
+    if mode not in _ACCESS_MODES:
+        msg = f"Invalid mode: {mode!r}, expected one of {list(_ACCESS_MODES)}."
+        raise ValueError(msg)
+    return AiofilesContextManager(
+        _mmap_open(file, mode=mode, loop=loop, executor=executor)
+    )
+
+
+async def _mmap_open(file, mode="r", *, loop=None, executor=None):
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    cb = partial(_sync_mmap_open, file, mode)
+    m = await run_in_executor(loop, executor, cb)
+    return AsyncMmapFile(m, loop=loop, executor=executor)
+
+
+def _sync_mmap_open(file, mode):
+    with FileIO(file, "r" if mode != "r+" else "r+") as f:
+        # The map keeps its own file descriptor.
+        return mmap.mmap(f.fileno(), 0, access=_ACCESS_MODES[mode])
+
+
+@delegate_to_executor("close", "find", "flush", "read", "readline", "rfind", "size")
+@proxy_method_directly("seek", "tell")
+@proxy_property_directly("closed")
+class AsyncMmapFile:
+    """The asyncio executor version of mmap.mmap.
+
+    Indexing and slicing are served directly from the map on the event loop,
+    which is fast for pages that are resident in memory but blocks on page
+    faults for others: use `prefetch()` to have pages brought in by a worker
+    thread first. Other operations that may touch many pages are delegated
+    to the executor.
+    """
+
+    _batcher = None
+    _read_ahead = None
+    _write_behind = None
+
+    def __init__(self, file, loop, executor):
+        self._file = file
+        self._loop = loop
+        self._executor = executor
+        self._bound = _bind_methods(file, self._delegated)
+
+    def __len__(self):
+        return len(self._file)
+
+    def __getitem__(self, key):
+        return self._file[key]
+
+    def __setitem__(self, key, value):
+        self._file[key] = value
+
+    def __repr__(self):
+        return super().__repr__() + " wrapping " + repr(self._file)
+
+    async def prefetch(self, offset=0, length=None):
+        """Bring a range of the file into memory, in a worker thread."""
+        cb = partial(_prefetch, self._file, offset, length)
+        await run_in_executor(self._loop, self._executor, cb)
+
+
+def _prefetch(m, offset, length):
+    end = len(m) if length is None else min(len(m), offset + length)
+    # Ranges for madvise() must start on a page boundary.
+    start = offset - offset % mmap.PAGESIZE
+    if start >= end:
+        return
+    if hasattr(m, "madvise") and hasattr(mmap, "MADV_WILLNEED"):
+        m.madvise(mmap.MADV_WILLNEED, start, end - start)
+    # Read a byte of every page, so they're resident when we return.
+    for position in range(start, end, mmap.PAGESIZE):
+        m[position]
@@ -1,13 +1,22 @@
 """Async executor versions of file functions from the os module."""
 
+import asyncio
 import os
+from asyncio import FIRST_COMPLETED
+from collections import deque
+from functools import partial, wraps
+from itertools import islice
 
+from . import _syscalls
 from . import ospath as path
-from .base import wrap
+from .base import wrap, wrap_many
+from .executor import run_in_executor
+from .statcache import get_stat_cache
 
 __all__ = [
     "path",
     "stat",
+    "stat_many",
     "rename",
     "renames",
     "replace",
@@ -24,6 +33,7 @@ __all__ = [
     "access",
     "wrap",
     "getcwd",
+    "walk",
 ]
 
 access = wrap(os.access)
@@ -43,13 +53,123 @@ renames = wrap(os.renames)
 replace = wrap(os.replace)
 rmdir = wrap(os.rmdir)
 
-scandir = wrap(os.scandir)
-stat = wrap(os.stat)
+_stat = wrap(os.stat)
+
+
+@wraps(os.stat)
+async def stat(path, *, dir_fd=None, follow_symlinks=True, loop=None, executor=None):
+    cache = get_stat_cache()
+    if cache is None or dir_fd is not None or isinstance(path, int):
+        return await _stat(
+            path,
+            dir_fd=dir_fd,
+            follow_symlinks=follow_symlinks,
+            loop=loop,
+            executor=executor,
+        )
+    return await cache.stat(
+        path, follow_symlinks=follow_symlinks, loop=loop, executor=executor
+    )
+
+
+stat_many = wrap_many(os.stat)
 symlink = wrap(os.symlink)
 
 unlink = wrap(os.unlink)
 
+DEFAULT_SCANDIR_BATCH_SIZE = 1024
+
+
+def scandir(
+    path=".", *, batch_size=DEFAULT_SCANDIR_BATCH_SIZE, loop=None, executor=None
+):
+    """List a directory, like `os.scandir`.
+
+    Iterating the result with `async for` fetches entries in batches of
+    `batch_size`, one executor job per batch, so huge directories neither
+    block the event loop nor need to be held in memory at once. Use it as an
+    async context manager to close the directory early. Awaiting the result
+    instead returns a regular `os.scandir` iterator, as in earlier versions.
+    """
+    return AsyncScandirIterator(path, batch_size, loop, executor)
+
+
+class AsyncScandirIterator:
+    """An async iterator over the entries of a directory."""
+
+    def __init__(self, path, batch_size, loop, executor):
+        if batch_size <= 0:
+            msg = "batch_size must be greater than 0"
+            raise ValueError(msg)
+        self._path = path
+        self._batch_size = batch_size
+        self._ref_loop = loop
+        self._executor = executor
+        self._iterator = None
+        self._entries = deque()
+        self._exhausted = False
+
+    @property
+    def _loop(self):
+        return self._ref_loop or asyncio.get_running_loop()
+
+    def __await__(self):
+        cb = partial(os.scandir, self._path)
+        return run_in_executor(self._loop, self._executor, cb).__await__()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._entries:
+            if self._exhausted:
+                raise StopAsyncIteration
+            if self._iterator is None:
+                cb = partial(_open_scandir, self._path, self._batch_size)
+                self._iterator, batch = await run_in_executor(
+                    self._loop, self._executor, cb
+                )
+            else:
+                cb = partial(_scandir_batch, self._iterator, self._batch_size)
+                batch = await run_in_executor(self._loop, self._executor, cb)
+            if len(batch) < self._batch_size:
+                # The iterator closes itself once exhausted.
+                self._exhausted = True
+            self._entries.extend(batch)
+            if not self._entries:
+                raise StopAsyncIteration
+        return self._entries.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the directory, skipping any remaining entries."""
+        self._entries.clear()
+        self._exhausted = True
+        if self._iterator is not None:
+            await run_in_executor(self._loop, self._executor, self._iterator.close)
 
+
+def _open_scandir(path, batch_size):
+    iterator = os.scandir(path)
+    try:
+        return iterator, _scandir_batch(iterator, batch_size)
+    except BaseException:
+        iterator.close()
+        raise
+
+
+def _scandir_batch(iterator, batch_size):
+    return list(islice(iterator, batch_size))
+
+
+if hasattr(os, "copy_file_range"):
+    __all__ += ["copy_file_range"]
+    copy_file_range = wrap(os.copy_file_range)
 if hasattr(os, "link"):
     __all__ += ["link"]
     link = wrap(os.link)
@@ -59,3 +179,120 @@ if hasattr(os, "sendfile"):
 if hasattr(os, "statvfs"):
     __all__ += ["statvfs"]
     statvfs = wrap(os.statvfs)
+
+
+if _syscalls.sync_file_range is not None:
+    from ._syscalls import (
+        SYNC_FILE_RANGE_WAIT_AFTER,
+        SYNC_FILE_RANGE_WAIT_BEFORE,
+        SYNC_FILE_RANGE_WRITE,
+    )
+
+    __all__ += [
+        "sync_file_range",
+        "SYNC_FILE_RANGE_WAIT_BEFORE",
+        "SYNC_FILE_RANGE_WRITE",
+        "SYNC_FILE_RANGE_WAIT_AFTER",
+    ]
+    sync_file_range = wrap(_syscalls.sync_file_range)
+
+
+async def walk(
+    top,
+    topdown=True,
+    onerror=None,
+    followlinks=False,
+    *,
+    concurrency=8,
+    loop=None,
+    executor=None,
+):
+    """Generate the entries of a directory tree, like `os.walk`.
+
+    Each directory is yielded as a `(dirpath, dirs, files)` batch, where
+    `dirs` and `files` are lists of `os.DirEntry` rather than names, so the
+    file types they cache can be used without more system calls. Up to
+    `concurrency` directories are listed at once, each in its own executor
+    job, and yielded as their listings come in. The order is
+    therefore not the one of `os.walk`, but with `topdown` a directory is
+    still yielded before its subdirectories (which can be pruned by
+    removing them from `dirs` in place), and otherwise after all of them.
+    """
+    if concurrency <= 0:
+        msg = "concurrency must be greater than 0"
+        raise ValueError(msg)
+    if loop is None:
+        loop = asyncio.get_running_loop()
+
+    pending = [_WalkNode(os.fspath(top), None)]
+    scanning = {}
+    try:
+        while pending or scanning:
+            while pending and len(scanning) < concurrency:
+                node = pending.pop()
+                cb = partial(_scan_dir, node.path)
+                scanning[run_in_executor(loop, executor, cb)] = node
+            done, _ = await asyncio.wait(scanning, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = scanning.pop(future)
+                try:
+                    node.dirs, node.files, symlinks = future.result()
+                except OSError as exc:
+                    if onerror is not None:
+                        onerror(exc)
+                    node.dirs = None
+                    symlinks = ()
+                if topdown and node.dirs is not None:
+                    yield node.path, node.dirs, node.files
+                children = [
+                    _WalkNode(entry.path, node)
+                    for entry in node.dirs or ()
+                    if followlinks or entry.name not in symlinks
+                ]
+                node.remaining = len(children)
+                pending.extend(reversed(children))
+                if not topdown:
+                    # Yield this directory and any parents it was the last
+                    # subdirectory of.
+                    while node is not None and not node.remaining:
+                        if node.dirs is not None:
+                            yield node.path, node.dirs, node.files
+                        node = node.parent
+                        if node is not None:
+                            node.remaining -= 1
+    finally:
+        for future in scanning:
+            future.cancel()
+
+
+class _WalkNode:
+    __slots__ = ("dirs", "files", "parent", "path", "remaining")
+
+    def __init__(self, path, parent):
+        self.path = path
+        self.parent = parent
+        self.dirs = None
+        self.files = None
+        self.remaining = 0
+
+
+def _scan_dir(path):
+    dirs = []
+    files = []
+    symlinks = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry)
+                continue
+            dirs.append(entry)
+            try:
+                if entry.is_symlink():
+                    symlinks.add(entry.name)
+            except OSError:
+                pass
+    return dirs, files, symlinks
@@ -1,8 +1,11 @@
 """Async executor versions of file functions from the os.path module."""
 
+from operator import attrgetter
 from os import path
+from stat import S_ISDIR, S_ISLNK, S_ISREG
 
-from .base import wrap
+from .base import wrap, wrap_many
+from .statcache import wrap_cached
 
 __all__ = [
     "abspath",
@@ -10,7 +13,9 @@ __all__ = [
     "getctime",
     "getmtime",
     "getsize",
+    "getsize_many",
     "exists",
+    "exists_many",
     "isdir",
     "isfile",
     "islink",
@@ -21,16 +26,23 @@ __all__ = [
 
 abspath = wrap(path.abspath)
 
-getatime = wrap(path.getatime)
-getctime = wrap(path.getctime)
-getmtime = wrap(path.getmtime)
-getsize = wrap(path.getsize)
-
-exists = wrap(path.exists)
-
-isdir = wrap(path.isdir)
-isfile = wrap(path.isfile)
-islink = wrap(path.islink)
+getatime = wrap_cached(path.getatime, attrgetter("st_atime"))
+getctime = wrap_cached(path.getctime, attrgetter("st_ctime"))
+getmtime = wrap_cached(path.getmtime, attrgetter("st_mtime"))
+getsize = wrap_cached(path.getsize, attrgetter("st_size"))
+getsize_many = wrap_many(path.getsize)
+
+exists = wrap_cached(path.exists, lambda _: True, default=False)
+exists_many = wrap_many(path.exists)
+
+isdir = wrap_cached(path.isdir, lambda st: S_ISDIR(st.st_mode), default=False)
+isfile = wrap_cached(path.isfile, lambda st: S_ISREG(st.st_mode), default=False)
+islink = wrap_cached(
+    path.islink,
+    lambda st: S_ISLNK(st.st_mode),
+    default=False,
+    follow_symlinks=False,
+)
 ismount = wrap(path.ismount)
 
 samefile = wrap(path.samefile)
@@ -0,0 +1,84 @@
+"""Read whole files using several executor workers at once."""
+
+import asyncio
+import os
+import threading
+from collections import deque
+from functools import partial
+from io import FileIO
+
+from .executor import run_in_executor
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "read_parallel"]
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+async def read_parallel(
+    path, *, workers=4, chunk_size=DEFAULT_CHUNK_SIZE, loop=None, executor=None
+):
+    """Read the file at `path` into a new `bytearray`, using `workers` jobs.
+
+    The file is split into `chunk_size` ranges, which the workers read
+    concurrently, each through its own file handle, straight into their
+    place in the result. This is useful for saturating fast storage when
+    reading large files. If the file shrinks while being read, the result is
+    cut at the first range that came up short.
+    """
+    if workers <= 0:
+        msg = "workers must be greater than 0"
+        raise ValueError(msg)
+    if chunk_size <= 0:
+        msg = "chunk_size must be greater than 0"
+        raise ValueError(msg)
+    if loop is None:
+        loop = asyncio.get_running_loop()
+
+    size = (await run_in_executor(loop, executor, partial(os.stat, path))).st_size
+    result = bytearray(size)
+    ranges = deque((offset, chunk_size) for offset in range(0, size, chunk_size))
+    state = _ReadState(size)
+
+    view = memoryview(result)
+    jobs = [
+        run_in_executor(
+            loop, executor, partial(_read_ranges, path, view, ranges, state)
+        )
+        for _ in range(min(workers, len(ranges)))
+    ]
+    try:
+        await asyncio.gather(*jobs)
+    finally:
+        # On errors or cancellation, have the other workers stop early.
+        state.stop.set()
+    view.release()
+    del result[state.end :]
+    return result
+
+
+class _ReadState:
+    __slots__ = ("end", "lock", "stop")
+
+    def __init__(self, end):
+        self.end = end
+        self.lock = threading.Lock()
+        self.stop = threading.Event()
+
+
+def _read_ranges(path, view, ranges, state):
+    with FileIO(path) as f:
+        while not state.stop.is_set():
+            try:
+                offset, length = ranges.popleft()
+            except IndexError:
+                return
+            target = view[offset : offset + length]
+            f.seek(offset)
+            while target:
+                read = f.readinto(target)
+                if not read:
+                    with state.lock:
+                        state.end = min(state.end, offset)
+                    break
+                offset += read
+                target = target[read:]
@@ -0,0 +1,74 @@
+"""Async executor versions of file functions from the shutil module.
+
+Copies use the same machinery as `aiofiles.copyfile`: reflinks on file
+systems supporting them, then `os.copy_file_range` and `os.sendfile`, and
+plain reads and writes as a last resort. Each function runs entirely in a
+single executor job.
+"""
+
+import os
+import shutil
+
+from .base import wrap
+from .transfer import _copyfile
+
+__all__ = [
+    "copyfile",
+    "copy",
+    "copy2",
+    "copytree",
+]
+
+
+def _sync_copyfile(src, dst, *, follow_symlinks=True):
+    """Copy data from `src` to `dst`, like `shutil.copyfile`."""
+    if not follow_symlinks and os.path.islink(src):
+        os.symlink(os.readlink(src), dst)
+    else:
+        _copyfile(src, dst)
+    return dst
+
+
+def _sync_copy(src, dst, *, follow_symlinks=True):
+    """Copy data and mode bits from `src` to `dst`, like `shutil.copy`."""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    _sync_copyfile(src, dst, follow_symlinks=follow_symlinks)
+    shutil.copymode(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+def _sync_copy2(src, dst, *, follow_symlinks=True):
+    """Copy data and metadata from `src` to `dst`, like `shutil.copy2`."""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    _sync_copyfile(src, dst, follow_symlinks=follow_symlinks)
+    shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+    return dst
+
+
+def _sync_copytree(
+    src,
+    dst,
+    symlinks=False,
+    ignore=None,
+    copy_function=_sync_copy2,
+    ignore_dangling_symlinks=False,
+    dirs_exist_ok=False,
+):
+    """Copy a directory tree, like `shutil.copytree`."""
+    return shutil.copytree(
+        src,
+        dst,
+        symlinks=symlinks,
+        ignore=ignore,
+        copy_function=copy_function,
+        ignore_dangling_symlinks=ignore_dangling_symlinks,
+        dirs_exist_ok=dirs_exist_ok,
+    )
+
+
+copyfile = wrap(_sync_copyfile)
+copy = wrap(_sync_copy)
+copy2 = wrap(_sync_copy2)
+copytree = wrap(_sync_copytree)
@@ -0,0 +1,169 @@
+"""An opt-in cache for `stat` results.
+
+Once enabled, `aiofiles.os.stat` and the `aiofiles.os.path` predicates
+(`exists`, `isfile`, `isdir`, `islink`, `getsize`, `getmtime`, `getatime`
+and `getctime`) are answered from recent `stat` results when possible,
+without a trip to the executor. Results, including errors like missing files,
+are kept for `ttl` seconds, and the least recently used ones are evicted
+beyond `maxsize` entries. Since changes made to files aren't detected before
+the TTL runs out, invalidate paths you know changed.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from copy import copy
+from functools import partial, wraps
+from typing import NamedTuple
+
+from .base import wrap
+from .executor import run_in_executor
+
+__all__ = [
+    "CacheInfo",
+    "StatCache",
+    "disable_stat_cache",
+    "enable_stat_cache",
+    "get_stat_cache",
+]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+_settings = {"cache": None}
+
+
+class StatCache:
+    """A bounded LRU cache of `stat` results, expiring after `ttl` seconds."""
+
+    def __init__(self, maxsize=4096, ttl=1.0):
+        if maxsize <= 0:
+            msg = "maxsize must be greater than 0"
+            raise ValueError(msg)
+        if ttl <= 0:
+            msg = "ttl must be greater than 0"
+            raise ValueError(msg)
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    def info(self):
+        """Return the hit and miss counters, and the size of the cache."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    def invalidate(self, path):
+        """Forget the results for `path`."""
+        path = os.fspath(path)
+        with self._lock:
+            self._entries.pop((path, True), None)
+            self._entries.pop((path, False), None)
+
+    def clear(self):
+        """Forget all results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    async def stat(self, path, *, follow_symlinks=True, loop=None, executor=None):
+        """Return the `stat` result for `path`, from the cache if possible."""
+        key = (os.fspath(path), follow_symlinks)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                result, exc = entry[1:]
+                if exc is not None:
+                    # Raise a copy, the original would accumulate tracebacks.
+                    raise copy(exc)
+                return result
+            self._misses += 1
+
+        cb = partial(_stat, key[0], follow_symlinks)
+        if loop is None:
+            loop = asyncio.get_running_loop()
+        result, exc = await run_in_executor(loop, executor, cb, "stat")
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, result, exc)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        if exc is not None:
+            raise copy(exc)
+        return result
+
+
+def _stat(path, follow_symlinks):
+    try:
+        return os.stat(path, follow_symlinks=follow_symlinks), None
+    except OSError as exc:
+        return None, exc
+
+
+def enable_stat_cache(maxsize=4096, ttl=1.0):
+    """Start caching `stat` results, returning the new cache."""
+    cache = StatCache(maxsize=maxsize, ttl=ttl)
+    _settings["cache"] = cache
+    return cache
+
+
+def disable_stat_cache():
+    """Stop caching `stat` results."""
+    _settings["cache"] = None
+
+
+def get_stat_cache():
+    """Return the current cache, or `None` if caching is disabled."""
+    return _settings["cache"]
+
+
+_RAISE = object()
+
+
+def wrap_cached(func, from_stat, *, default=_RAISE, follow_symlinks=True):
+    """Wrap a single-path `os.path` function to use the stat cache if enabled.
+
+    `from_stat` computes the result of `func` from a `stat` result. If
+    `default` is given, it is returned when `stat` fails instead of raising.
+    """
+    wrapped = wrap(func)
+
+    @wraps(func)
+    async def run(path, *, loop=None, executor=None):
+        cache = _settings["cache"]
+        if cache is None or isinstance(path, int):
+            return await wrapped(path, loop=loop, executor=executor)
+        try:
+            result = await cache.stat(
+                path, follow_symlinks=follow_symlinks, loop=loop, executor=executor
+            )
+        except (OSError, ValueError):
+            if default is _RAISE:
+                raise
+            return default
+        return from_stat(result)
+
+    return run
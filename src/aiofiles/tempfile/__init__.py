@@ -9,6 +9,7 @@ from tempfile import TemporaryFile as syncTemporaryFile
 from tempfile import _TemporaryFileWrapper as syncTemporaryFileWrapper
 
 from ..base import AiofilesContextManager
+from ..executor import run_in_executor
 from ..threadpool.binary import AsyncBufferedIOBase, AsyncBufferedReader, AsyncFileIO
 from ..threadpool.text import AsyncTextIOWrapper
 from .temptypes import AsyncSpooledTemporaryFile, AsyncTemporaryDirectory
@@ -205,7 +206,7 @@ if sys.version_info >= (3, 12):
                 dir=dir,
             )
 
-        f = await loop.run_in_executor(executor, cb)
+        f = await run_in_executor(loop, executor, cb)
 
         # Wrap based on type of underlying IO object
         if type(f) is syncTemporaryFileWrapper:
@@ -260,7 +261,7 @@ else:
                 dir=dir,
             )
 
-        f = await loop.run_in_executor(executor, cb)
+        f = await run_in_executor(loop, executor, cb)
 
         # Wrap based on type of underlying IO object
         if type(f) is syncTemporaryFileWrapper:
@@ -301,7 +302,7 @@ async def _spooled_temporary_file(
         dir=dir,
     )
 
-    f = await loop.run_in_executor(executor, cb)
+    f = await run_in_executor(loop, executor, cb)
 
     # Single interface provided by SpooledTemporaryFile for all modes
     return AsyncSpooledTemporaryFile(f, loop=loop, executor=executor)
@@ -315,7 +316,7 @@ async def _temporary_directory(
         loop = asyncio.get_running_loop()
 
     cb = partial(syncTemporaryDirectory, suffix, prefix, dir)
-    f = await loop.run_in_executor(executor, cb)
+    f = await run_in_executor(loop, executor, cb)
 
     return AsyncTemporaryDirectory(f, loop=loop, executor=executor)
 
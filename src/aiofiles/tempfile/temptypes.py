@@ -2,11 +2,12 @@
 
 from functools import partial
 
-from ..base import AsyncBase
+from ..base import AsyncBase, _bind_methods
 from ..threadpool.utils import (
     cond_delegate_to_executor,
     delegate_to_executor,
     proxy_property_directly,
+    submit,
 )
 
 
@@ -26,6 +27,8 @@ from ..threadpool.utils import (
 class AsyncSpooledTemporaryFile(AsyncBase):
     """Async wrapper for SpooledTemporaryFile class"""
 
+    __slots__ = ()
+
     async def _check(self):
         if self._file._rolled:
             return
@@ -37,7 +40,7 @@ class AsyncSpooledTemporaryFile(AsyncBase):
         """Implementation to anticipate rollover"""
         if self._file._rolled:
             cb = partial(self._file.write, s)
-            return await self._loop.run_in_executor(self._executor, cb)
+            return await submit(self, cb)
 
         file = self._file._file  # reference underlying base IO object
         rv = file.write(s)
@@ -48,7 +51,7 @@ class AsyncSpooledTemporaryFile(AsyncBase):
         """Implementation to anticipate rollover"""
         if self._file._rolled:
             cb = partial(self._file.writelines, iterable)
-            return await self._loop.run_in_executor(self._executor, cb)
+            return await submit(self, cb)
 
         file = self._file._file  # reference underlying base IO object
         rv = file.writelines(iterable)
@@ -61,10 +64,15 @@ class AsyncSpooledTemporaryFile(AsyncBase):
 class AsyncTemporaryDirectory:
     """Async wrapper for TemporaryDirectory class"""
 
+    _batcher = None
+    _read_ahead = None
+    _write_behind = None
+
     def __init__(self, file, loop, executor):
         self._file = file
         self._loop = loop
         self._executor = executor
+        self._bound = _bind_methods(file, self._delegated)
 
     async def close(self):
         await self.cleanup()
@@ -13,11 +13,14 @@ from io import (
 )
 
 from ..base import AiofilesContextManager
+from ..executor import run_in_executor
 from .binary import (
+    NOWAIT_AVAILABLE,
     AsyncBufferedIOBase,
     AsyncBufferedReader,
     AsyncFileIO,
     AsyncIndirectBufferedIOBase,
+    AsyncNowaitFileIO,
 )
 from .text import AsyncTextIndirectIOWrapper, AsyncTextIOWrapper
 
@@ -25,6 +28,12 @@ sync_open = open
 
 __all__ = (
     "open",
+    "read_bytes",
+    "read_text",
+    "write_bytes",
+    "write_text",
+    "get_default_engine",
+    "set_default_engine",
     "stdin",
     "stdout",
     "stderr",
@@ -33,6 +42,31 @@ __all__ = (
     "stderr_bytes",
 )
 
+ENGINES = ("thread", "nowait")
+_settings = {"engine": "thread"}
+
+
+def get_default_engine():
+    """Return the engine used by `open` when none is given."""
+    return _settings["engine"]
+
+
+def set_default_engine(engine):
+    """Set the engine used by `open` when none is given.
+
+    `"thread"` delegates every operation to the executor. `"nowait"` serves
+    reads of cached data of unbuffered binary files directly on the event
+    loop, and falls back to `"thread"` on platforms without `RWF_NOWAIT`.
+    """
+    _check_engine(engine)
+    _settings["engine"] = engine
+
+
+def _check_engine(engine):
+    if engine not in ENGINES:
+        msg = f"Unknown engine: {engine!r}, expected one of {ENGINES}."
+        raise ValueError(msg)
+
 
 def open(
     file,
@@ -46,7 +80,10 @@ def open(
     *,
     loop=None,
     executor=None,
+    engine=None,
 ):
+    if engine is not None:
+        _check_engine(engine)
     return AiofilesContextManager(
         _open(
             file,
@@ -59,6 +96,7 @@ def open(
             opener=opener,
             loop=loop,
             executor=executor,
+            engine=engine,
         )
     )
 
@@ -75,6 +113,7 @@ async def _open(
     *,
     loop=None,
     executor=None,
+    engine=None,
 ):
     """Open an asyncio file."""
     if loop is None:
@@ -90,11 +129,66 @@ async def _open(
         closefd=closefd,
         opener=opener,
     )
-    f = await loop.run_in_executor(executor, cb)
+    f = await run_in_executor(loop, executor, cb)
 
+    if engine is None:
+        engine = _settings["engine"]
+    if engine == "nowait" and NOWAIT_AVAILABLE and type(f) is FileIO:
+        return AsyncNowaitFileIO(f, loop=loop, executor=executor)
     return wrap(f, loop=loop, executor=executor)
 
 
+async def read_bytes(file, *, loop=None, executor=None):
+    """Return the contents of a file as bytes, in a single executor job."""
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    return await run_in_executor(loop, executor, partial(_read, file, "rb"))
+
+
+async def read_text(
+    file, encoding=None, errors=None, newline=None, *, loop=None, executor=None
+):
+    """Return the decoded contents of a file, in a single executor job."""
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    cb = partial(_read, file, "r", encoding=encoding, errors=errors, newline=newline)
+    return await run_in_executor(loop, executor, cb)
+
+
+async def write_bytes(file, data, *, loop=None, executor=None):
+    """Replace the contents of a file with bytes, in a single executor job."""
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    # Like pathlib, accept any bytes-like object.
+    data = memoryview(data)
+    return await run_in_executor(loop, executor, partial(_write, file, "wb", data))
+
+
+async def write_text(
+    file, data, encoding=None, errors=None, newline=None, *, loop=None, executor=None
+):
+    """Replace the contents of a file with text, in a single executor job."""
+    if not isinstance(data, str):
+        msg = f"data must be str, not {type(data).__name__}"
+        raise TypeError(msg)
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    cb = partial(
+        _write, file, "w", data, encoding=encoding, errors=errors, newline=newline
+    )
+    return await run_in_executor(loop, executor, cb)
+
+
+def _read(file, mode, **kwargs):
+    with sync_open(file, mode, **kwargs) as f:
+        return f.read()
+
+
+def _write(file, mode, data, **kwargs):
+    with sync_open(file, mode, **kwargs) as f:
+        return f.write(data)
+
+
 @singledispatch
 def wrap(file, *, loop=None, executor=None):
     msg = f"Unsupported io type: {file}."
@@ -1,10 +1,52 @@
-from ..base import AsyncBase, AsyncIndirectBase
-from .utils import delegate_to_executor, proxy_method_directly, proxy_property_directly
+import os
+from functools import partial
+
+from ..base import AsyncBase, AsyncIndirectBase, _ordered_batcher
+from ..executor import run_in_executor
+from .readahead import (
+    DEFAULT_READ_AHEAD_CHUNK_SIZE,
+    DEFAULT_READ_AHEAD_DEPTH,
+    ReadAhead,
+)
+from .utils import (
+    delegate_fd_to_executor,
+    delegate_to_executor,
+    proxy_method_directly,
+    proxy_property_directly,
+    submit,
+)
+from .writebehind import (
+    DEFAULT_FLUSH_DELAY,
+    DEFAULT_FLUSH_SIZE,
+    DEFAULT_HIGH_WATER,
+    WriteBehind,
+)
+
+
+async def _iter_chunks_into(self, pool):
+    """Read the file in chunks, into buffers acquired from `pool`.
+
+    Yields memoryviews of the filled part of each buffer. Release them back
+    to the pool once done with them; reading stalls while all the buffers of
+    the pool are in use.
+    """
+    while True:
+        buffer = await pool.acquire()
+        try:
+            read = await self.readinto(buffer)
+        except BaseException:
+            pool.release(buffer)
+            raise
+        if not read:
+            pool.release(buffer)
+            return
+        yield memoryview(buffer)[:read]
 
 
+@delegate_fd_to_executor(
+    "fsync", "fdatasync", "fadvise", "fallocate", "sync_file_range"
+)
 @delegate_to_executor(
-    "close",
-    "flush",
     "isatty",
     "read",
     "read1",
@@ -16,7 +58,6 @@ from .utils import delegate_to_executor, proxy_method_directly, proxy_property_d
     "tell",
     "truncate",
     "writable",
-    "write",
     "writelines",
 )
 @proxy_method_directly("detach", "fileno", "readable")
@@ -24,19 +65,96 @@ from .utils import delegate_to_executor, proxy_method_directly, proxy_property_d
 class AsyncBufferedIOBase(AsyncBase):
     """The asyncio executor version of io.BufferedWriter and BufferedIOBase."""
 
+    __slots__ = ()
+
+    iter_chunks_into = _iter_chunks_into
+
+    def enable_write_behind(
+        self,
+        *,
+        flush_size=DEFAULT_FLUSH_SIZE,
+        flush_delay=DEFAULT_FLUSH_DELAY,
+        high_water=DEFAULT_HIGH_WATER,
+    ):
+        """Have writes buffered on the event loop, and written in the background.
+
+        Writes then return immediately, unless more than `high_water` bytes
+        are waiting to be written. Buffered data is handed to the executor
+        once there are `flush_size` bytes of it, after `flush_delay` seconds,
+        or before any other call on the file. Errors of background writes
+        are raised by the next `write()`, `flush()` or `close()`.
+        """
+        if self._write_behind is None:
+            # Background writes are submitted without waiting for them.
+            _ordered_batcher(self)
+            self._write_behind = WriteBehind(self, flush_size, flush_delay, high_water)
+
+    async def write(self, b):
+        if self._write_behind is not None:
+            return await self._write_behind.write(b)
+        return await submit(self, partial(self._file.write, b))
+
+    async def flush(self):
+        await submit(self, self._file.flush)
+        if self._write_behind is not None:
+            self._write_behind.raise_error()
+
+    async def close(self):
+        await submit(self, self._file.close)
+        if self._write_behind is not None:
+            self._write_behind.raise_error()
+
+
+def _enable_read_ahead(
+    self, *, chunk_size=DEFAULT_READ_AHEAD_CHUNK_SIZE, depth=DEFAULT_READ_AHEAD_DEPTH
+):
+    """Keep reads of the next `depth` chunks of `chunk_size` bytes in flight.
+
+    `read()` and `readinto()` are then served from chunks read in the
+    background, so reading overlaps with processing the data. Any other call,
+    like `seek()`, disables read-ahead, moving the file position back to
+    after the data handed out so far. That needs a seekable file.
+    """
+    if self._read_ahead is None:
+        if self._write_behind is not None:
+            # Buffered writes would otherwise stop read-ahead on their way out.
+            self._write_behind.submit_buffer()
+        # Chunks are read in the background without waiting for them.
+        _ordered_batcher(self)
+        self._read_ahead = ReadAhead(self, chunk_size, depth)
+
+
+async def _read(self, size=-1):
+    if self._read_ahead is not None:
+        return await self._read_ahead.read(size)
+    return await submit(self, partial(self._file.read, size))
+
+
+async def _readinto(self, b):
+    if self._read_ahead is not None:
+        return await self._read_ahead.readinto(b)
+    return await submit(self, partial(self._file.readinto, b))
+
 
 @delegate_to_executor("peek")
 class AsyncBufferedReader(AsyncBufferedIOBase):
     """The asyncio executor version of io.BufferedReader and Random."""
 
+    __slots__ = ()
 
+    enable_read_ahead = _enable_read_ahead
+    read = _read
+    readinto = _readinto
+
+
+@delegate_fd_to_executor(
+    "fsync", "fdatasync", "fadvise", "fallocate", "sync_file_range"
+)
 @delegate_to_executor(
     "close",
     "flush",
     "isatty",
-    "read",
     "readall",
-    "readinto",
     "readline",
     "readlines",
     "seek",
@@ -52,6 +170,119 @@ class AsyncBufferedReader(AsyncBufferedIOBase):
 class AsyncFileIO(AsyncBase):
     """The asyncio executor version of io.FileIO."""
 
+    __slots__ = ()
+
+    iter_chunks_into = _iter_chunks_into
+    enable_read_ahead = _enable_read_ahead
+    read = _read
+    readinto = _readinto
+
+    if hasattr(os, "pread"):
+
+        async def pread(self, size, offset):
+            """Read up to `size` bytes at `offset`.
+
+            Positional calls don't use or move the file position, so unlike
+            other calls they don't wait for each other and may run
+            concurrently on the same file.
+            """
+            cb = partial(os.pread, self._file.fileno(), size, offset)
+            return await run_in_executor(self._loop, self._executor, cb)
+
+        async def preadinto(self, b, offset):
+            """Read into the writable buffer `b` at `offset`."""
+            cb = partial(_preadinto, self._file.fileno(), b, offset)
+            return await run_in_executor(self._loop, self._executor, cb)
+
+    if hasattr(os, "pwrite"):
+
+        async def pwrite(self, b, offset):
+            """Write `b` at `offset`, returning the number of bytes written."""
+            cb = partial(os.pwrite, self._file.fileno(), b, offset)
+            return await run_in_executor(self._loop, self._executor, cb)
+
+
+def _preadinto(fd, b, offset):
+    if hasattr(os, "preadv"):
+        return os.preadv(fd, [b], offset)
+    view = memoryview(b).cast("B")
+    data = os.pread(fd, len(view), offset)
+    view[: len(data)] = data
+    return len(data)
+
+
+NOWAIT_AVAILABLE = hasattr(os, "preadv") and hasattr(os, "RWF_NOWAIT")
+
+
+class AsyncNowaitFileIO(AsyncFileIO):
+    """An io.FileIO wrapper serving reads of cached data on the event loop.
+
+    Reads are first attempted with `preadv2(RWF_NOWAIT)`, which never blocks
+    and only succeeds if the data is already in the page cache. Otherwise,
+    they are delegated to the executor like in `AsyncFileIO`. Like any raw
+    read, a read may return fewer bytes than requested.
+    """
+
+    __slots__ = ()
+
+    async def read(self, size=-1):
+        if size is not None and size >= 0:
+            buf = bytearray(size)
+            read = self._readinto_nowait(buf)
+            if read is not None:
+                del buf[read:]
+                return bytes(buf)
+        return await super().read(size)
+
+    async def readinto(self, b):
+        read = self._readinto_nowait(b)
+        if read is not None:
+            return read
+        return await super().readinto(b)
+
+    async def pread(self, size, offset):
+        buf = bytearray(size)
+        read = self._preadinto_nowait(buf, offset)
+        if read is None:
+            return await super().pread(size, offset)
+        del buf[read:]
+        return bytes(buf)
+
+    async def preadinto(self, b, offset):
+        read = self._preadinto_nowait(b, offset)
+        if read is not None:
+            return read
+        return await super().preadinto(b, offset)
+
+    def _readinto_nowait(self, b):
+        """Read into `b` without blocking, or return `None` if we can't."""
+        if self._read_ahead is not None or (
+            self._batcher is not None and self._batcher.busy
+        ):
+            # Calls still queued for the executor need to go first.
+            return None
+        if self._file.closed:
+            return None
+        fd = self._file.fileno()
+        try:
+            pos = os.lseek(fd, 0, os.SEEK_CUR)
+        except OSError:
+            return None
+        read = self._preadinto_nowait(b, pos)
+        if read is not None:
+            os.lseek(fd, pos + read, os.SEEK_SET)
+        return read
+
+    def _preadinto_nowait(self, b, offset):
+        if self._file.closed:
+            return None
+        try:
+            return os.preadv(self._file.fileno(), [b], offset, os.RWF_NOWAIT)
+        except OSError:
+            # Not cached (EAGAIN), not seekable, not supported by the file
+            # system... The executor will handle it, including any errors.
+            return None
+
 
 @delegate_to_executor(
     "close",
@@ -75,11 +306,15 @@ class AsyncFileIO(AsyncBase):
 class AsyncIndirectBufferedIOBase(AsyncIndirectBase):
     """The indirect asyncio executor version of io.BufferedWriter and BufferedIOBase."""
 
+    __slots__ = ()
+
 
 @delegate_to_executor("peek")
 class AsyncIndirectBufferedReader(AsyncIndirectBufferedIOBase):
     """The indirect asyncio executor version of io.BufferedReader and Random."""
 
+    __slots__ = ()
+
 
 @delegate_to_executor(
     "close",
@@ -102,3 +337,5 @@ class AsyncIndirectBufferedReader(AsyncIndirectBufferedIOBase):
 @proxy_property_directly("closed", "name", "mode")
 class AsyncIndirectFileIO(AsyncIndirectBase):
     """The indirect asyncio executor version of io.FileIO."""
+
+    __slots__ = ()
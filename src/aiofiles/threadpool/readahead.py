@@ -0,0 +1,213 @@
+"""Read-ahead for async binary files."""
+
+import asyncio
+import os
+from collections import deque
+from functools import partial
+
+from ..base import DEFAULT_CHUNK_SIZE
+from .utils import _submit_to_batcher, submit
+
+DEFAULT_READ_AHEAD_CHUNK_SIZE = DEFAULT_CHUNK_SIZE
+DEFAULT_READ_AHEAD_DEPTH = 2
+
+
+class ReadAhead:
+    """Keep reads of the next chunks of an async file in flight.
+
+    Up to `depth` reads of `chunk_size` bytes are queued on the executor
+    ahead of the consumer, who is served from their results. Reads stop
+    being queued once the end of the file is reached.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_chunk_size",
+        "_depth",
+        "_detached",
+        "_eof",
+        "_file",
+        "_jobs",
+        "_last",
+    )
+
+    def __init__(self, file, chunk_size, depth):
+        if chunk_size <= 0 or depth <= 0:
+            msg = "chunk_size and depth must be greater than 0"
+            raise ValueError(msg)
+        self._file = file
+        self._chunk_size = chunk_size
+        self._depth = depth
+        self._buffer = memoryview(b"")
+        # Reads in flight, with a cell for the size they read.
+        self._jobs = deque()
+        self._eof = False
+        # Done once the last turn taken is over.
+        self._last = None
+        self._detached = False
+
+    @property
+    def busy(self):
+        """Whether reads are running or waiting for their turn."""
+        return self._last is not None and not self._last.done()
+
+    def turn(self):
+        """Take a turn after the reads issued so far, as a context manager.
+
+        Reads take turns, as they consume the chunks in flight one after
+        the other. Other calls take one to detach read-ahead once the reads
+        issued before them are done.
+        """
+        previous = self._last
+        self._last = _Turn(previous, self._file._loop.create_future())
+        return self._last
+
+    async def read(self, size=-1):
+        async with self.turn():
+            if self._detached:
+                # Another call came in first, and disabled read-ahead.
+                return await submit(self._file, partial(self._file._file.read, size))
+            if size is None or size < 0:
+                return await self._read_all()
+            return await self._read(size)
+
+    async def readinto(self, b):
+        with memoryview(b) as view, view.cast("B") as target:
+            data = await self.read(len(target))
+            target[: len(data)] = data
+        return len(data)
+
+    def detach(self):
+        """Stop reading ahead, moving the file position back to the consumer's.
+
+        This only queues the repositioning, which therefore runs before any
+        call queued afterwards. It mustn't be called while reads are running,
+        as they need the chunks in flight.
+        """
+        if self._detached:
+            return
+        self._detached = True
+        unconsumed = len(self._buffer)
+        cells = [cell for _, cell in self._jobs]
+        for job, _ in self._jobs:
+            job.add_done_callback(_retrieve)
+        self._jobs.clear()
+        self._buffer = memoryview(b"")
+        if unconsumed or cells:
+            cb = partial(_rewind, self._file._file, unconsumed, cells)
+            _submit_to_batcher(self._file, cb, "seek").add_done_callback(_retrieve)
+
+    async def _read(self, size):
+        buffer = self._buffer
+        if len(buffer) >= size:
+            self._buffer = buffer[size:]
+            return bytes(buffer[:size])
+        parts = [buffer]
+        missing = size - len(buffer)
+        self._buffer = memoryview(b"")
+        try:
+            while missing:
+                if self._eof and not self._jobs:
+                    # The file may have grown since.
+                    data = await self._submit(
+                        partial(self._file._file.read, missing), "read"
+                    )
+                    if data:
+                        parts.append(data)
+                    break
+                chunk = memoryview(await self._next_chunk())
+                if not chunk:
+                    continue
+                parts.append(chunk[:missing])
+                self._buffer = chunk[missing:]
+                missing -= len(parts[-1])
+        except BaseException:
+            # Keep what was read for the next call.
+            parts.append(self._buffer)
+            self._buffer = memoryview(b"".join(parts))
+            raise
+        return b"".join(parts)
+
+    async def _read_all(self):
+        parts = [self._buffer]
+        self._buffer = memoryview(b"")
+        self._eof = True  # Don't queue more reads.
+        while self._jobs:
+            parts.append(await self._next_chunk())
+        parts.append(await self._submit(self._file._file.read, "read") or b"")
+        return b"".join(parts)
+
+    async def _next_chunk(self):
+        self._fill()
+        job, _ = self._jobs[0]
+        # Don't lose the chunk if we're cancelled, it'll be picked up next.
+        await asyncio.wait([job])
+        self._jobs.popleft()
+        data = job.result()
+        if not data:
+            self._eof = True
+        self._fill()
+        return data or b""
+
+    def _fill(self):
+        while not self._eof and len(self._jobs) < self._depth:
+            cell = [0]
+            cb = partial(_read_chunk, self._file._file, self._chunk_size, cell)
+            self._jobs.append((self._submit(cb, "read"), cell))
+
+    def _submit(self, cb, name):
+        write_behind = self._file._write_behind
+        if write_behind is not None:
+            # Reads must see the writes buffered before them.
+            write_behind.submit_buffer()
+        return _submit_to_batcher(self._file, cb, name)
+
+
+class _Turn:
+    __slots__ = ("_done", "_previous")
+
+    def __init__(self, previous, done):
+        self._previous = previous
+        self._done = done
+
+    def done(self):
+        return self._done.done()
+
+    async def __aenter__(self):
+        previous = self._previous
+        if previous is not None and not previous.done():
+            try:
+                await asyncio.wait([previous._done])
+            except BaseException:
+                self._end()
+                raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._end()
+
+    def _end(self):
+        # Turns end in order, even if this one was cancelled while waiting.
+        previous = self._previous
+        self._previous = None
+        if previous is None or previous.done():
+            self._done.set_result(None)
+        else:
+            previous._done.add_done_callback(lambda _: self._done.set_result(None))
+
+
+def _read_chunk(file, size, cell):
+    data = file.read(size)
+    if data:
+        cell[0] = len(data)
+    return data
+
+
+def _rewind(file, unconsumed, cells):
+    if offset := unconsumed + sum(cell[0] for cell in cells):
+        file.seek(-offset, os.SEEK_CUR)
+
+
+def _retrieve(job):
+    """Mark the outcome of a job nobody waits for as retrieved."""
+    if not job.cancelled():
+        job.exception()
@@ -1,7 +1,15 @@
 from ..base import AsyncBase, AsyncIndirectBase
-from .utils import delegate_to_executor, proxy_method_directly, proxy_property_directly
+from .utils import (
+    delegate_fd_to_executor,
+    delegate_to_executor,
+    proxy_method_directly,
+    proxy_property_directly,
+)
 
 
+@delegate_fd_to_executor(
+    "fsync", "fdatasync", "fadvise", "fallocate", "sync_file_range"
+)
 @delegate_to_executor(
     "close",
     "flush",
@@ -32,6 +40,8 @@ from .utils import delegate_to_executor, proxy_method_directly, proxy_property_d
 class AsyncTextIOWrapper(AsyncBase):
     """The asyncio executor version of io.TextIOWrapper."""
 
+    __slots__ = ()
+
 
 @delegate_to_executor(
     "close",
@@ -62,3 +72,5 @@ class AsyncTextIOWrapper(AsyncBase):
 )
 class AsyncTextIndirectIOWrapper(AsyncIndirectBase):
     """The indirect asyncio executor version of io.TextIOWrapper."""
+
+    __slots__ = ()
@@ -1,10 +1,16 @@
+import asyncio
 import functools
+import os
+
+from .._syscalls import SYNC_FILE_RANGE_WRITE, sync_file_range
+from ..executor import Batcher
 
 
 def delegate_to_executor(*attrs):
     def cls_builder(cls):
         for attr_name in attrs:
             setattr(cls, attr_name, _make_delegate_method(attr_name))
+        cls._delegated = (*getattr(cls, "_delegated", ()), *attrs)
         return cls
 
     return cls_builder
@@ -37,10 +43,70 @@ def cond_delegate_to_executor(*attrs):
     return cls_builder
 
 
+def delegate_fd_to_executor(*attrs):
+    """Add methods running `os` functions on the file descriptor of the file.
+
+    Methods for functions the platform lacks are left out.
+    """
+
+    def cls_builder(cls):
+        for attr_name in attrs:
+            func, flush = _FD_METHODS[attr_name]
+            if func is not None:
+                setattr(cls, attr_name, _make_fd_method(attr_name, func, flush))
+        return cls
+
+    return cls_builder
+
+
+def submit(obj, cb, name=None):
+    """Run `cb` on the executor of `obj`, in order with its other calls.
+
+    The call is reported to metrics hooks as `name`, by default the name of
+    `cb`.
+    """
+    write_behind = obj._write_behind
+    if write_behind is not None:
+        # Writes still buffered on the loop go first.
+        write_behind.submit_buffer()
+    # Other calls need the file position where the consumer left it.
+    read_ahead = obj._read_ahead
+    if read_ahead is not None:
+        if read_ahead.busy:
+            # Reads issued earlier need the chunks in flight.
+            turn = read_ahead.turn()
+            return asyncio.ensure_future(_submit_after(turn, obj, cb, name))
+        _detach_read_ahead(obj)
+    return _submit_to_batcher(obj, cb, name)
+
+
+async def _submit_after(turn, obj, cb, name):
+    async with turn:
+        _detach_read_ahead(obj)
+        job = _submit_to_batcher(obj, cb, name)
+    return await job
+
+
+def _detach_read_ahead(obj):
+    read_ahead = obj._read_ahead
+    if read_ahead is not None:
+        obj._read_ahead = None
+        read_ahead.detach()
+
+
+def _submit_to_batcher(obj, cb, name=None):
+    batcher = obj._batcher
+    if batcher is None:
+        batcher = obj._batcher = Batcher()
+    return batcher.submit(obj._loop, obj._executor, cb, name)
+
+
 def _make_delegate_method(attr_name):
     async def method(self, *args, **kwargs):
-        cb = functools.partial(getattr(self._file, attr_name), *args, **kwargs)
-        return await self._loop.run_in_executor(self._executor, cb)
+        cb = self._bound.get(attr_name) or getattr(self._file, attr_name)
+        if args or kwargs:
+            cb = functools.partial(cb, *args, **kwargs)
+        return await submit(self, cb)
 
     return method
 
@@ -65,7 +131,38 @@ def _make_cond_delegate_method(attr_name):
     async def method(self, *args, **kwargs):
         if self._file._rolled:
             cb = functools.partial(getattr(self._file, attr_name), *args, **kwargs)
-            return await self._loop.run_in_executor(self._executor, cb)
+            return await submit(self, cb)
         return getattr(self._file, attr_name)(*args, **kwargs)
 
     return method
+
+
+def _sync_file_range_defaults(fd, offset=0, nbytes=0, flags=SYNC_FILE_RANGE_WRITE):
+    return sync_file_range(fd, offset, nbytes, flags)
+
+
+# The function behind each method, and whether buffers are flushed first.
+_FD_METHODS = {
+    "fsync": (os.fsync, True),
+    "fdatasync": (getattr(os, "fdatasync", None), True),
+    "fadvise": (getattr(os, "posix_fadvise", None), False),
+    "fallocate": (getattr(os, "posix_fallocate", None), False),
+    "sync_file_range": (
+        None if sync_file_range is None else _sync_file_range_defaults,
+        True,
+    ),
+}
+
+
+def _make_fd_method(attr_name, func, flush):
+    async def method(self, *args, **kwargs):
+        cb = functools.partial(_call_with_fd, self._file, func, flush, args, kwargs)
+        return await submit(self, cb, attr_name)
+
+    return method
+
+
+def _call_with_fd(file, func, flush, args, kwargs):
+    if flush:
+        file.flush()
+    return func(file.fileno(), *args, **kwargs)
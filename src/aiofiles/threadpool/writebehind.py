@@ -0,0 +1,106 @@
+"""Write-behind buffering for async binary files."""
+
+import asyncio
+from collections import deque
+from functools import partial
+
+from ..base import DEFAULT_CHUNK_SIZE
+from .utils import _detach_read_ahead, _submit_to_batcher
+
+DEFAULT_FLUSH_SIZE = DEFAULT_CHUNK_SIZE
+DEFAULT_FLUSH_DELAY = 0.01
+DEFAULT_HIGH_WATER = 16 * DEFAULT_CHUNK_SIZE
+
+
+class WriteBehind:
+    """Buffer writes to an async file on the event loop.
+
+    Writes are appended to a buffer and return immediately. The buffer is
+    handed to the executor once it holds `flush_size` bytes, or `flush_delay`
+    seconds after the first write into it. Writes wait while more than
+    `high_water` bytes are buffered or being written. Errors of background
+    writes are raised by the next write, flush or close.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_error",
+        "_file",
+        "_flush_delay",
+        "_flush_size",
+        "_high_water",
+        "_jobs",
+        "_pending",
+        "_timer",
+    )
+
+    def __init__(self, file, flush_size, flush_delay, high_water):
+        if flush_size <= 0 or high_water <= 0:
+            msg = "flush_size and high_water must be greater than 0"
+            raise ValueError(msg)
+        if flush_delay < 0:
+            msg = "flush_delay must not be negative"
+            raise ValueError(msg)
+        self._file = file
+        self._flush_size = flush_size
+        self._flush_delay = flush_delay
+        self._high_water = high_water
+        self._buffer = bytearray()
+        self._jobs = deque()  # Background writes, oldest first.
+        self._pending = 0  # Bytes buffered or being written.
+        self._timer = None
+        self._error = None
+
+    async def write(self, b):
+        self.raise_error()
+        # The data goes where the consumer left off, not where reads ahead
+        # got to.
+        read_ahead = self._file._read_ahead
+        if read_ahead is not None and read_ahead.busy:
+            async with read_ahead.turn():
+                _detach_read_ahead(self._file)
+        else:
+            _detach_read_ahead(self._file)
+        with memoryview(b) as view:
+            size = view.nbytes
+            self._buffer += view
+        self._pending += size
+        if len(self._buffer) >= self._flush_size or self._pending > self._high_water:
+            self.submit_buffer()
+        elif self._timer is None:
+            self._timer = self._file._loop.call_later(
+                self._flush_delay, self.submit_buffer
+            )
+        while self._pending > self._high_water and self._jobs:
+            await asyncio.wait([self._jobs[0]])
+        return size
+
+    def submit_buffer(self):
+        """Hand the buffered data to the executor."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        _detach_read_ahead(self._file)
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        job = _submit_to_batcher(self._file, partial(self._file._file.write, data))
+        self._jobs.append(job)
+        job.add_done_callback(partial(self._done, len(data)))
+
+    def raise_error(self):
+        """Raise the error of a background write, if any."""
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+
+    def _done(self, size, job):
+        self._jobs.remove(job)
+        self._pending -= size
+        if not job.cancelled():
+            error = job.exception()
+            # Only the first error is raised, later ones are likely the same.
+            if self._error is None:
+                self._error = error
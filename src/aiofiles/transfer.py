@@ -0,0 +1,194 @@
+"""Copy files, and send them to transports, without going through Python."""
+
+import asyncio
+import errno
+import os
+import sys
+import threading
+from contextlib import suppress
+from functools import partial
+from io import FileIO
+from shutil import SameFileError
+
+from .executor import run_in_executor
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "copyfile", "send_to_transport"]
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Errors meaning a zero-copy method isn't usable for these files at all.
+_UNSUPPORTED_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in (
+        "EINVAL",
+        "ENOSYS",
+        "ENOTSOCK",
+        "ENOTSUP",
+        "ENOTTY",
+        "EOPNOTSUPP",
+        "EXDEV",
+    )
+    if hasattr(errno, name)
+)
+
+
+async def copyfile(
+    src,
+    dst,
+    *,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    progress=None,
+    loop=None,
+    executor=None,
+):
+    """Copy the contents of the file `src` to `dst`, returning `dst`.
+
+    The whole copy runs in a single executor job. Where possible, `dst`
+    is made a reflink of `src` (sharing its data on copy-on-write file
+    systems), or the data is copied using `os.copy_file_range` or
+    `os.sendfile` so it never passes through Python. Otherwise, the file is
+    read and written in `chunk_size` chunks.
+    `progress`, if given, is called on the event loop with the number of
+    bytes copied so far after every chunk. If cancelled, the copy stops after
+    the current chunk, leaving `dst` partially written.
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    if progress is not None:
+        progress = partial(loop.call_soon_threadsafe, progress)
+    cancelled = threading.Event()
+    job = run_in_executor(
+        loop,
+        executor,
+        partial(_copyfile, src, dst, chunk_size, progress, cancelled),
+    )
+    try:
+        await asyncio.shield(job)
+    except asyncio.CancelledError:
+        cancelled.set()
+        # Don't return while the job may still be writing.
+        with suppress(Exception):
+            await job
+        raise
+    return dst
+
+
+async def send_to_transport(
+    file, writer, *, offset=0, count=None, chunk_size=DEFAULT_CHUNK_SIZE, progress=None
+):
+    """Send a binary file to a transport or stream writer.
+
+    This uses `loop.sendfile()`, which sends data straight from the file to
+    the socket with `os.sendfile` where possible, in chunks of `chunk_size`
+    bytes. `progress`, if given, is called with the number of bytes sent so
+    far after every chunk. Returns the total number of bytes sent.
+    """
+    loop = asyncio.get_running_loop()
+    file = getattr(file, "_file", file)  # Unwrap aiofiles files.
+    transport = getattr(writer, "transport", writer)
+    if hasattr(writer, "drain"):
+        await writer.drain()
+
+    sent = 0
+    while count is None or sent < count:
+        size = chunk_size if count is None else min(chunk_size, count - sent)
+        chunk = await loop.sendfile(transport, file, offset + sent, size)
+        sent += chunk
+        if progress is not None and chunk:
+            progress(sent)
+        if chunk < size:
+            break
+    return sent
+
+
+def _copyfile(src, dst, chunk_size=DEFAULT_CHUNK_SIZE, progress=None, cancelled=None):
+    with FileIO(src) as fsrc:
+        # Only truncate the destination once we know it's not the source.
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        with FileIO(os.open(dst, flags, 0o666), "w") as fdst:
+            src_stat = os.fstat(fsrc.fileno())
+            dst_stat = os.fstat(fdst.fileno())
+            if (src_stat.st_dev, src_stat.st_ino) == (
+                dst_stat.st_dev,
+                dst_stat.st_ino,
+            ):
+                msg = f"{src!r} and {dst!r} are the same file"
+                raise SameFileError(msg)
+            fdst.truncate(0)
+            copied = 0
+            for chunk in _copy_fd(fsrc.fileno(), fdst.fileno(), chunk_size):
+                copied += chunk
+                if progress is not None:
+                    progress(copied)
+                if cancelled is not None and cancelled.is_set():
+                    return
+
+
+def _copy_fd(src_fd, dst_fd, chunk_size):
+    """Copy from the position of `src_fd` to `dst_fd`, yielding chunk sizes.
+
+    Tries the fastest method first, moving to the next one if it turns out
+    to be unsupported, or copies nothing (some special files claim to be
+    empty to zero-copy methods), before anything was copied.
+    """
+    for method in _COPY_METHODS:
+        copied = 0
+        try:
+            for chunk in method(src_fd, dst_fd, chunk_size):
+                copied += chunk
+                yield chunk
+        except OSError as exc:
+            if copied or exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+        else:
+            if copied:
+                return
+
+
+def _ficlone(src_fd, dst_fd, chunk_size):
+    # Cloning is all or nothing, so it only works for whole files.
+    if os.lseek(src_fd, 0, os.SEEK_CUR) or os.lseek(dst_fd, 0, os.SEEK_CUR):
+        raise OSError(errno.EINVAL, os.strerror(errno.EINVAL))
+    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    if size := os.fstat(src_fd).st_size:
+        os.lseek(src_fd, size, os.SEEK_SET)
+        os.lseek(dst_fd, size, os.SEEK_SET)
+        yield size
+
+
+def _copy_file_range(src_fd, dst_fd, chunk_size):
+    while chunk := os.copy_file_range(src_fd, dst_fd, chunk_size):
+        yield chunk
+
+
+def _sendfile(src_fd, dst_fd, chunk_size):
+    offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+    while chunk := os.sendfile(dst_fd, src_fd, offset, chunk_size):
+        offset += chunk
+        yield chunk
+    os.lseek(src_fd, offset, os.SEEK_SET)
+
+
+def _read_write(src_fd, dst_fd, chunk_size):
+    while data := os.read(src_fd, chunk_size):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+        yield len(data)
+
+
+if sys.platform == "linux":
+    import fcntl
+
+    _FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+_COPY_METHODS = [
+    method
+    for method, available in (
+        (_ficlone, sys.platform == "linux"),
+        (_copy_file_range, hasattr(os, "copy_file_range")),
+        (_sendfile, hasattr(os, "sendfile")),
+        (_read_write, True),
+    )
+    if available
+]
@@ -0,0 +1,190 @@
+"""Detection of slow executor operations.
+
+Once enabled, the watchdog keeps track of the operations aiofiles runs on
+executors, from when they're submitted until they finish. Operations taking
+longer than `threshold` seconds, queue wait included, are reported once to
+`callback` as a `SlowOperation`, with the stack of the task awaiting them.
+Without a callback, they're logged as warnings to the `aiofiles.watchdog`
+logger. The watchdog also counts the operations in flight on each executor.
+
+The watchdog is a hook of `aiofiles.metrics`. Operations are checked on
+their event loop every `interval` seconds, so a report can come up to
+`interval` seconds after the threshold passes.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import traceback
+import weakref
+from typing import NamedTuple, Optional
+
+from .metrics import Operation, add_hook, remove_hook
+
+__all__ = [
+    "InFlight",
+    "SlowOperation",
+    "Watchdog",
+    "disable_watchdog",
+    "enable_watchdog",
+    "get_watchdog",
+]
+
+logger = logging.getLogger(__name__)
+
+_settings = {"watchdog": None}
+
+
+class SlowOperation(NamedTuple):
+    name: str
+    path: Optional[str]
+    elapsed: float
+    # The formatted stack of the awaiting task, empty if unknown.
+    stack: str
+    task: Optional[asyncio.Task]
+    operation: Operation
+
+
+class InFlight(NamedTuple):
+    queued: int
+    running: int
+
+
+class _Entry:
+    __slots__ = ("loop", "reported", "task")
+
+    def __init__(self, loop, task):
+        self.loop = loop
+        self.task = task
+        self.reported = False
+
+
+class Watchdog:
+    """Report executor operations running longer than `threshold` seconds."""
+
+    def __init__(self, threshold=1.0, *, callback=None, interval=None):
+        if threshold <= 0:
+            msg = "threshold must be greater than 0"
+            raise ValueError(msg)
+        if interval is None:
+            interval = threshold / 4
+        elif interval <= 0:
+            msg = "interval must be greater than 0"
+            raise ValueError(msg)
+        self._threshold = threshold
+        self._interval = interval
+        self._callback = callback if callback is not None else _log
+        self._lock = threading.Lock()
+        # Operations are removed from executor threads.
+        self._in_flight = {}
+        self._timers = weakref.WeakKeyDictionary()
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    def in_flight(self):
+        """Return the numbers of operations in flight, by executor."""
+        with self._lock:
+            operations = list(self._in_flight)
+        counts = {}
+        for operation in operations:
+            queued, running = counts.get(operation.executor, (0, 0))
+            if operation.started is None:
+                queued += 1
+            else:
+                running += 1
+            counts[operation.executor] = (queued, running)
+        return {executor: InFlight(*count) for executor, count in counts.items()}
+
+    def __call__(self, operation):
+        """Track `operation`, as a hook of `aiofiles.metrics`."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        task = asyncio.current_task() if loop is not None else None
+        with self._lock:
+            self._in_flight[operation] = _Entry(loop, task)
+        if loop is not None and loop not in self._timers:
+            self._timers[loop] = loop.call_later(self._interval, self._check, loop)
+        return self._finished
+
+    def _finished(self, operation):
+        with self._lock:
+            self._in_flight.pop(operation, None)
+
+    def _check(self, loop):
+        self._timers.pop(loop, None)
+        now = time.perf_counter()
+        slow = []
+        pending = False
+        with self._lock:
+            for operation, entry in self._in_flight.items():
+                if entry.loop is not loop:
+                    continue
+                pending = True
+                if not entry.reported and now - operation.queued >= self._threshold:
+                    entry.reported = True
+                    slow.append((operation, entry.task))
+        if pending:
+            self._timers[loop] = loop.call_later(self._interval, self._check, loop)
+        for operation, task in slow:
+            self._callback(
+                SlowOperation(
+                    operation.name,
+                    operation.path,
+                    now - operation.queued,
+                    _format_stack(task),
+                    task,
+                    operation,
+                )
+            )
+
+    def _stop(self):
+        for timer in list(self._timers.values()):
+            timer.cancel()
+        self._timers.clear()
+
+
+def _format_stack(task):
+    if task is None:
+        return ""
+    frames = [(frame, frame.f_lineno) for frame in task.get_stack()]
+    return "".join(traceback.StackSummary.extract(frames).format())
+
+
+def _log(slow):
+    logger.warning(
+        "aiofiles operation %s on %s has been running for %.3f seconds, "
+        "awaited by %r:\n%s",
+        slow.name,
+        slow.path,
+        slow.elapsed,
+        slow.task,
+        slow.stack,
+    )
+
+
+def enable_watchdog(threshold=1.0, *, callback=None, interval=None):
+    """Start watching for slow operations, returning the new watchdog."""
+    watchdog = Watchdog(threshold, callback=callback, interval=interval)
+    disable_watchdog()
+    add_hook(watchdog)
+    _settings["watchdog"] = watchdog
+    return watchdog
+
+
+def disable_watchdog():
+    """Stop watching for slow operations."""
+    watchdog = _settings["watchdog"]
+    if watchdog is not None:
+        _settings["watchdog"] = None
+        remove_hook(watchdog)
+        watchdog._stop()
+
+
+def get_watchdog():
+    """Return the current watchdog, or `None` if disabled."""
+    return _settings["watchdog"]
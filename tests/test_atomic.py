@@ -0,0 +1,133 @@
+"""Tests for atomic writes."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import aiofiles
+import aiofiles.atomic
+
+
+async def test_atomic_write_text(tmp_path):
+    """The file is replaced when the block exits."""
+    path = tmp_path / "file"
+    path.write_text("old")
+
+    async with aiofiles.atomic_write(path, encoding="utf-8") as f:
+        await f.write("new")
+        await f.write(" data")
+        assert path.read_text() == "old"
+
+    assert path.read_text() == "new data"
+    assert os.listdir(tmp_path) == ["file"]
+
+
+async def test_atomic_write_binary(tmp_path):
+    """Binary modes are supported, and new files created."""
+    path = tmp_path / "file"
+
+    async with aiofiles.atomic_write(str(path), "wb") as f:
+        await f.write(b"\x00\x01")
+
+    assert path.read_bytes() == b"\x00\x01"
+    (tmp_path / "reference").write_bytes(b"")
+    assert path.stat().st_mode == (tmp_path / "reference").stat().st_mode
+
+
+async def test_atomic_write_error(tmp_path):
+    """On errors, the file is left untouched and the temporary file removed."""
+    path = tmp_path / "file"
+    path.write_text("old")
+
+    with pytest.raises(RuntimeError):
+        async with aiofiles.atomic_write(path) as f:
+            await f.write("new")
+            raise RuntimeError
+
+    assert path.read_text() == "old"
+    assert os.listdir(tmp_path) == ["file"]
+
+
+async def test_cancelled_before_commit(tmp_path):
+    """Cancelling while the commit is queued removes the temporary file."""
+    path = tmp_path / "file"
+    executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    loop = asyncio.get_running_loop()
+    blocker = None
+    files = []
+
+    async def write():
+        nonlocal blocker
+        async with aiofiles.atomic_write(path, executor=executor) as f:
+            files.append(f)
+            await f.write("new")
+            # Keep the only thread busy, so the commit stays queued.
+            blocker = loop.run_in_executor(executor, release.wait)
+
+    task = asyncio.ensure_future(write())
+    try:
+        while blocker is None:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert os.listdir(tmp_path) == []
+    assert files[0].closed
+
+
+async def test_atomic_write_syncs(tmp_path, monkeypatch):
+    """The file and its directory are synced."""
+    synced = []
+    fsync = os.fsync
+
+    def recording_fsync(fd):
+        synced.append(os.path.isdir(f"/proc/self/fd/{fd}"))
+        fsync(fd)
+
+    monkeypatch.setattr(aiofiles.atomic.os, "fsync", recording_fsync)
+
+    async with aiofiles.atomic_write(tmp_path / "file") as f:
+        await f.write("data")
+
+    if os.name != "nt":
+        assert synced == [False, True]
+
+
+async def test_batched_dir_syncs(tmp_path, monkeypatch):
+    """Concurrent writes to the same directory share directory syncs."""
+    dir_syncs = []
+    sync_dir = aiofiles.atomic._sync_dir
+
+    def recording_sync_dir(directory):
+        dir_syncs.append(directory)
+        sync_dir(directory)
+
+    monkeypatch.setattr(aiofiles.atomic, "_sync_dir", recording_sync_dir)
+
+    async def write(i):
+        async with aiofiles.atomic_write(tmp_path / str(i), batch_dir_sync=True) as f:
+            await f.write(str(i))
+
+    await asyncio.gather(*(write(i) for i in range(20)))
+
+    assert sorted(os.listdir(tmp_path)) == sorted(str(i) for i in range(20))
+    assert 1 <= len(dir_syncs) < 20
+    assert set(dir_syncs) == {str(tmp_path)}
+    assert aiofiles.atomic._dir_syncs[asyncio.get_running_loop()] == {}
+
+
+async def test_invalid_mode(tmp_path):
+    """Only modes truncating the file are allowed."""
+    with pytest.raises(ValueError, match="Invalid mode"):
+        async with aiofiles.atomic_write(tmp_path / "file", "a"):
+            pass
@@ -0,0 +1,98 @@
+"""Tests for buffer pools and reading into them."""
+
+import asyncio
+
+import pytest
+
+import aiofiles
+from aiofiles.buffers import BufferPool
+
+
+async def test_acquire_and_release():
+    """Buffers are allocated lazily and reused once released."""
+    pool = BufferPool(16, count=2)
+    assert pool.available == 2
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    assert len(first) == len(second) == pool.buffer_size == 16
+    assert first is not second
+    assert pool.available == 0
+
+    pool.release(memoryview(first)[:4])
+    assert pool.available == 1
+    assert await pool.acquire() is first
+
+
+async def test_acquire_waits():
+    """Acquiring waits for a buffer to be released when all are in use."""
+    pool = BufferPool(16, count=1)
+    buffer = await pool.acquire()
+
+    waiting = asyncio.ensure_future(pool.acquire())
+    cancelled = asyncio.ensure_future(pool.acquire())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    cancelled.cancel()
+
+    pool.release(buffer)
+    assert await waiting is buffer
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert pool.available == 0
+
+
+async def test_release_checks_ownership():
+    """Only buffers acquired from the pool can be released, once."""
+    pool = BufferPool(16, count=1)
+    buffer = await pool.acquire()
+
+    with pytest.raises(ValueError):
+        pool.release(bytearray(16))
+    with pytest.raises(ValueError):
+        pool.release(await BufferPool(16).acquire())
+
+    pool.release(buffer)
+    with pytest.raises(ValueError):
+        pool.release(buffer)
+
+    with pytest.raises(ValueError):
+        BufferPool(0)
+    with pytest.raises(ValueError):
+        BufferPool(16, count=0)
+
+
+@pytest.mark.parametrize("buffering", [-1, 0])
+async def test_iter_chunks_into(tmp_path, buffering):
+    """Chunks are read into pooled buffers."""
+    path = tmp_path / "file.bin"
+    content = bytes(range(256)) * 10
+    path.write_bytes(content)
+    pool = BufferPool(1000, count=2)
+    chunks = []
+    buffers = set()
+
+    async with aiofiles.open(path, "rb", buffering=buffering) as f:
+        async for chunk in f.iter_chunks_into(pool):
+            assert isinstance(chunk, memoryview)
+            chunks.append(bytes(chunk))
+            buffers.add(id(chunk.obj))
+            pool.release(chunk)
+
+    assert b"".join(chunks) == content
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 560]
+    assert len(buffers) == 1
+    assert pool.available == 2
+
+
+async def test_iter_chunks_into_errors(tmp_path):
+    """Buffers are given back to the pool when reading fails."""
+    path = tmp_path / "file.bin"
+    pool = BufferPool(16, count=1)
+
+    async with aiofiles.open(path, "wb") as f:
+        with pytest.raises(OSError):
+            async for _ in f.iter_chunks_into(pool):
+                pass
+
+    assert pool.available == 1
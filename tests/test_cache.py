@@ -0,0 +1,145 @@
+"""Tests for the file content cache."""
+
+import asyncio
+import os
+
+import pytest
+
+import aiofiles.cache
+
+
+async def test_read_bytes(tmp_path):
+    """Contents are served from the cache while the file is unchanged."""
+    cache = aiofiles.cache.FileCache()
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+
+    assert await cache.read_bytes(path) == b"abc"
+    assert await cache.read_bytes(str(path)) == b"abc"
+    assert cache.info() == aiofiles.cache.CacheInfo(1, 1, cache.maxsize, 3)
+
+    path.write_bytes(b"abcd")
+    assert await cache.read_bytes(path) == b"abcd"
+    assert cache.info() == aiofiles.cache.CacheInfo(1, 2, cache.maxsize, 4)
+
+
+async def test_mtime_validation(tmp_path):
+    """A file rewritten with the same size is read again."""
+    cache = aiofiles.cache.FileCache()
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+    assert await cache.read_bytes(path) == b"abc"
+
+    path.write_bytes(b"xyz")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert await cache.read_bytes(path) == b"xyz"
+
+
+async def test_read_text(tmp_path):
+    """Text is decoded like files opened in text mode."""
+    cache = aiofiles.cache.FileCache()
+    path = tmp_path / "file"
+    path.write_bytes("a\r\nł\n".encode())
+
+    assert await cache.read_text(path, encoding="utf-8") == "a\nł\n"
+    assert await cache.read_text(path, encoding="utf-8", newline="") == "a\r\nł\n"
+    assert cache.info().misses == 1
+
+
+async def test_single_flight(tmp_path, monkeypatch):
+    """Concurrent lookups of the same path share a single read."""
+    cache = aiofiles.cache.FileCache()
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+    calls = []
+    read_if_changed = aiofiles.cache._read_if_changed
+
+    def counting(*args):
+        calls.append(args)
+        return read_if_changed(*args)
+
+    monkeypatch.setattr(aiofiles.cache, "_read_if_changed", counting)
+
+    results = await asyncio.gather(*(cache.read_bytes(path) for _ in range(10)))
+    assert results == [b"abc"] * 10
+    assert len(calls) == 1
+    # Every caller is counted.
+    assert cache.info().misses == 10
+
+    results = await asyncio.gather(*(cache.read_bytes(path) for _ in range(10)))
+    assert results == [b"abc"] * 10
+    assert len(calls) == 2
+    assert cache.info().hits == 10
+
+
+async def test_cancelling_one_caller(tmp_path):
+    """Cancelling one lookup doesn't affect others sharing its job."""
+    cache = aiofiles.cache.FileCache()
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+
+    first = asyncio.ensure_future(cache.read_bytes(path))
+    second = asyncio.ensure_future(cache.read_bytes(path))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == b"abc"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_eviction(tmp_path):
+    """The least recently used files are evicted beyond the size limit."""
+    cache = aiofiles.cache.FileCache(maxsize=10)
+    for name, size in (("a", 4), ("b", 4), ("c", 4), ("big", 11)):
+        (tmp_path / name).write_bytes(b"x" * size)
+
+    await cache.read_bytes(tmp_path / "a")
+    await cache.read_bytes(tmp_path / "b")
+    await cache.read_bytes(tmp_path / "a")
+    await cache.read_bytes(tmp_path / "c")
+    assert cache.info().currsize == 8
+
+    await cache.read_bytes(tmp_path / "a")
+    assert cache.info().hits == 2
+    await cache.read_bytes(tmp_path / "b")
+    assert cache.info().misses == 4
+
+    assert await cache.read_bytes(tmp_path / "big") == b"x" * 11
+    assert cache.info().currsize <= 10
+
+
+async def test_errors(tmp_path):
+    """Errors propagate, and drop the cached copy."""
+    cache = aiofiles.cache.FileCache()
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+    await cache.read_bytes(path)
+
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        await cache.read_bytes(path)
+    assert cache.info().currsize == 0
+
+
+async def test_invalidate_and_clear(tmp_path):
+    """Contents can be dropped explicitly."""
+    cache = aiofiles.cache.FileCache()
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+
+    await cache.read_bytes(path)
+    cache.invalidate(path)
+    assert cache.info().currsize == 0
+    await cache.read_bytes(path)
+    assert cache.info().misses == 2
+
+    cache.clear()
+    assert cache.info() == aiofiles.cache.CacheInfo(0, 0, cache.maxsize, 0)
+
+
+def test_invalid_size():
+    """The size limit must be positive."""
+    with pytest.raises(ValueError, match="maxsize"):
+        aiofiles.cache.FileCache(maxsize=0)
@@ -0,0 +1,91 @@
+"""Tests for the dedicated file I/O executor."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from os.path import dirname, join
+
+import pytest
+
+import aiofiles
+import aiofiles.executor
+import aiofiles.os
+import aiofiles.threadpool
+
+
+async def test_file_io_uses_dedicated_pool(monkeypatch):
+    """File operations run on the aiofiles pool, not the default executor."""
+    filename = join(dirname(__file__), "resources", "test_file1.txt")
+    thread_names = []
+
+    def new_open(*args, **kwargs):
+        thread_names.append(threading.current_thread().name)
+        return open(*args, **kwargs)
+
+    monkeypatch.setattr(aiofiles.threadpool, "sync_open", value=new_open)
+
+    async with aiofiles.open(filename) as f:
+        assert await f.read() == "0123456789"
+    thread_names.append(
+        await aiofiles.os.wrap(lambda: threading.current_thread().name)()
+    )
+
+    prefix = aiofiles.executor.THREAD_NAME_PREFIX
+    assert all(name.startswith(prefix) for name in thread_names)
+
+
+async def test_one_pool_per_loop():
+    """The pool is created once per loop and reused."""
+    loop = asyncio.get_running_loop()
+    executor = aiofiles.executor.get_executor()
+
+    assert executor is aiofiles.executor.get_executor(loop)
+    assert isinstance(executor, ThreadPoolExecutor)
+
+
+async def test_explicit_executor_overrides_pool():
+    """An explicitly passed executor is used instead of the aiofiles pool."""
+    filename = join(dirname(__file__), "resources", "test_file1.txt")
+
+    with ThreadPoolExecutor(1, thread_name_prefix="custom") as executor:
+        name = await aiofiles.os.wrap(lambda: threading.current_thread().name)(
+            executor=executor
+        )
+        async with aiofiles.open(filename, executor=executor) as f:
+            assert await f.read() == "0123456789"
+
+    assert name.startswith("custom")
+
+
+async def test_set_max_workers():
+    """Pools created after set_max_workers() use the new size."""
+    await aiofiles.executor.shutdown()
+    aiofiles.executor.set_max_workers(3)
+    try:
+        assert aiofiles.executor.get_max_workers() == 3
+        assert aiofiles.executor.get_executor()._max_workers == 3
+    finally:
+        aiofiles.executor.set_max_workers()
+        await aiofiles.executor.shutdown()
+
+    assert aiofiles.executor.get_max_workers() == aiofiles.executor.DEFAULT_MAX_WORKERS
+
+    with pytest.raises(ValueError):
+        aiofiles.executor.set_max_workers(0)
+
+
+async def test_shutdown():
+    """Shutting down the pool waits for jobs and a new pool is made on demand."""
+    executor = aiofiles.executor.get_executor()
+    await aiofiles.os.wrap(lambda: None)()
+
+    await aiofiles.executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+    assert aiofiles.executor.get_executor() is not executor
+    await aiofiles.os.getcwd()
+
+    # Shutting down twice is harmless.
+    await aiofiles.executor.shutdown()
+    await aiofiles.executor.shutdown()
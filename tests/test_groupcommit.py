@@ -0,0 +1,99 @@
+"""Tests for group commits."""
+
+import asyncio
+import os
+
+import pytest
+
+import aiofiles
+import aiofiles.groupcommit
+
+
+@pytest.fixture
+def syncs(monkeypatch):
+    """Record the syncs issued, by file descriptor."""
+    syncs = []
+    flush_and_sync = aiofiles.groupcommit._flush_and_sync
+
+    def recording(file, sync):
+        flush_and_sync(file, sync)
+        syncs.append(file.fileno())
+
+    monkeypatch.setattr(aiofiles.groupcommit, "_flush_and_sync", recording)
+    return syncs
+
+
+async def test_sync(tmp_path, syncs):
+    """Data written before syncing is flushed to the file."""
+    path = tmp_path / "log"
+    async with aiofiles.open(path, "wb") as f:
+        commit = aiofiles.GroupCommit(f)
+        await f.write(b"record\n")
+        await commit.sync()
+        assert path.read_bytes() == b"record\n"
+        assert syncs == [f.fileno()]
+
+
+async def test_concurrent_writers_share_syncs(tmp_path, syncs):
+    """Writers arriving during a sync share the next one."""
+    path = tmp_path / "log"
+    async with aiofiles.open(path, "a") as f:
+        commit = aiofiles.GroupCommit(f, datasync=False)
+
+        async def writer(i):
+            await f.write(f"{i}\n")
+            await commit.sync()
+
+        await asyncio.gather(*(writer(i) for i in range(50)))
+
+    assert sorted(path.read_text().split()) == sorted(str(i) for i in range(50))
+    assert 1 <= len(syncs) < 50
+
+
+async def test_max_delay(tmp_path, syncs):
+    """Syncs wait for more callers, up to the delay."""
+    async with aiofiles.open(tmp_path / "log", "wb") as f:
+        commit = aiofiles.GroupCommit(f, max_delay=0.05)
+        first = asyncio.ensure_future(commit.sync())
+        await asyncio.sleep(0.01)
+        assert not first.done()
+        second = asyncio.ensure_future(commit.sync())
+        await asyncio.gather(first, second)
+
+    assert len(syncs) == 1
+
+
+async def test_max_batch(tmp_path, syncs):
+    """Syncs start early once enough callers are waiting."""
+    loop = asyncio.get_running_loop()
+    async with aiofiles.open(tmp_path / "log", "wb") as f:
+        commit = aiofiles.GroupCommit(f, max_delay=60, max_batch=3)
+        start = loop.time()
+        await asyncio.gather(*(commit.sync() for _ in range(3)))
+
+    assert loop.time() - start < 10
+    assert len(syncs) == 1
+
+
+async def test_errors(tmp_path):
+    """Errors are raised to all the callers sharing the sync."""
+
+    def failing_sync(fd):
+        raise OSError(5, os.strerror(5))
+
+    async with aiofiles.open(tmp_path / "log", "wb") as f:
+        commit = aiofiles.GroupCommit(f, max_delay=0.01)
+        commit._sync = failing_sync
+        results = await asyncio.gather(
+            commit.sync(), commit.sync(), return_exceptions=True
+        )
+
+    assert [type(r) for r in results] == [OSError, OSError]
+
+
+def test_invalid_settings():
+    """The delay must not be negative, and the batch size positive."""
+    with pytest.raises(ValueError, match="max_delay"):
+        aiofiles.GroupCommit(None, max_delay=-1)
+    with pytest.raises(ValueError, match="max_batch"):
+        aiofiles.GroupCommit(None, max_batch=0)
@@ -0,0 +1,183 @@
+"""Tests for the instrumentation hooks and counters."""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import aiofiles
+import aiofiles.executor
+import aiofiles.metrics
+import aiofiles.os
+
+
+@pytest.fixture
+def metrics():
+    aiofiles.metrics.enable_metrics()
+    yield
+    aiofiles.metrics.disable_metrics()
+    aiofiles.metrics.reset_metrics()
+
+
+@pytest.fixture
+def operations():
+    """Record finished operations."""
+    operations = []
+
+    def hook(operation):
+        return operations.append
+
+    aiofiles.metrics.add_hook(hook)
+    yield operations
+    aiofiles.metrics.remove_hook(hook)
+
+
+async def test_counters(tmp_path, metrics):
+    """Operations are counted by name, with their bytes and errors."""
+    path = tmp_path / "file"
+    async with aiofiles.open(path, "wb") as f:
+        assert await f.write(b"abc") == 3
+        await f.write(b"de")
+    async with aiofiles.open(path, "rb") as f:
+        assert await f.read() == b"abcde"
+    with pytest.raises(FileNotFoundError):
+        await aiofiles.open(tmp_path / "missing")
+    await aiofiles.os.stat(path)
+
+    snapshot = aiofiles.metrics.metrics_snapshot()
+
+    assert snapshot["write"].calls == 2
+    assert snapshot["write"].nbytes == 5
+    assert snapshot["read"].nbytes == 5
+    assert snapshot["open"].calls == 3
+    assert snapshot["open"].errors == 1
+    assert snapshot["close"].calls == 2
+    assert snapshot["stat"].calls == 1
+    for stats in snapshot.values():
+        assert stats.queue_wait >= 0
+        assert stats.execution >= 0
+
+    aiofiles.metrics.reset_metrics()
+    assert aiofiles.metrics.metrics_snapshot() == {}
+
+
+async def test_disabled(tmp_path, metrics):
+    """Nothing is counted once disabled."""
+    aiofiles.metrics.disable_metrics()
+    await aiofiles.os.stat(tmp_path)
+    assert aiofiles.metrics.metrics_snapshot() == {}
+
+
+async def test_span_hooks(tmp_path):
+    """Hooks start in the submitting task's context, and end once finished."""
+    var = contextvars.ContextVar("var", default=None)
+    events = []
+
+    def hook(operation):
+        events.append(("start", operation.name, var.get()))
+
+        def end(operation):
+            events.append(("end", operation.name, operation.error))
+
+        return end
+
+    async def task():
+        var.set("task")
+        await aiofiles.os.stat(tmp_path)
+
+    aiofiles.metrics.add_hook(hook)
+    try:
+        await asyncio.create_task(task())
+    finally:
+        aiofiles.metrics.remove_hook(hook)
+
+    assert events == [("start", "stat", "task"), ("end", "stat", None)]
+
+
+async def test_operation_times(tmp_path, operations):
+    """Operations record their file, executor, and when they ran."""
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+    async with aiofiles.open(path, "rb") as f:
+        await f.read()
+
+    op = operations[1]
+    assert op.name == "read"
+    assert op.queued <= op.started <= op.ended
+    assert op.queue_wait == op.started - op.queued
+    assert op.execution == op.ended - op.started
+    assert op.nbytes == 3
+    assert op.path == str(path)
+    assert op.executor is aiofiles.executor.get_executor()
+
+
+async def test_names(tmp_path, operations):
+    """Calls are reported under the name of the method called."""
+    async with aiofiles.open(tmp_path / "file", "wb") as f:
+        await f.write(b"a")
+        await f.fsync()
+        await f.tell()
+
+    assert [op.name for op in operations] == [
+        "open",
+        "write",
+        "fsync",
+        "tell",
+        "close",
+    ]
+
+
+async def test_errors(tmp_path, operations):
+    """Errors are recorded on the operation."""
+    with pytest.raises(FileNotFoundError):
+        await aiofiles.os.remove(tmp_path / "missing")
+
+    assert operations[0].name == "remove"
+    assert isinstance(operations[0].error, FileNotFoundError)
+
+
+async def test_cancelled_before_start(tmp_path, operations):
+    """Operations cancelled while queued are reported as cancelled."""
+    executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    blocker = asyncio.get_running_loop().run_in_executor(executor, release.wait)
+    try:
+        job = asyncio.ensure_future(aiofiles.os.stat(tmp_path, executor=executor))
+        await asyncio.sleep(0.01)
+        job.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await job
+    finally:
+        release.set()
+        await blocker
+        executor.shutdown()
+
+    assert len(operations) == 1
+    assert operations[0].started is None
+    assert isinstance(operations[0].error, asyncio.CancelledError)
+
+
+async def test_hook_errors(tmp_path):
+    """Failing hooks are reported to the loop, without failing the operation."""
+    loop = asyncio.get_running_loop()
+    reported = []
+    loop.set_exception_handler(lambda loop, context: reported.append(context))
+
+    def hook(operation):
+        def end(operation):
+            raise RuntimeError
+
+        return end
+
+    aiofiles.metrics.add_hook(hook)
+    try:
+        assert await aiofiles.os.path.exists(tmp_path)
+        await asyncio.sleep(0)
+    finally:
+        aiofiles.metrics.remove_hook(hook)
+        loop.set_exception_handler(None)
+
+    assert len(reported) == 1
+    assert isinstance(reported[0]["exception"], RuntimeError)
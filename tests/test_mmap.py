@@ -0,0 +1,76 @@
+"""Tests for async memory-mapped files."""
+
+import mmap
+
+import pytest
+
+import aiofiles
+from aiofiles.mmap import AsyncMmapFile
+
+CONTENT = b"".join(b"line %d\n" % i for i in range(10_000))
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+async def test_read_only(path):
+    """Slices come straight from the map, other calls go to the executor."""
+    async with aiofiles.mmap_open(path) as m:
+        assert isinstance(m, AsyncMmapFile)
+        assert len(m) == len(CONTENT)
+        assert m[0] == CONTENT[0]
+        assert m[10:20] == CONTENT[10:20]
+        assert await m.size() == len(CONTENT)
+        assert await m.find(b"line 5000\n") == CONTENT.find(b"line 5000\n")
+        assert await m.rfind(b"line 1") == CONTENT.rfind(b"line 1")
+
+        assert await m.readline() == b"line 0\n"
+        assert m.tell() == 7
+        m.seek(0)
+        assert await m.read(4) == b"line"
+
+        with pytest.raises(TypeError):
+            m[0:4] = b"nope"
+
+    assert m.closed
+
+
+async def test_writes(path):
+    """Writes go to the file in r+ mode, and stay in memory in c mode."""
+    async with aiofiles.mmap_open(path, "c") as m:
+        m[0:4] = b"LINE"
+        assert m[0:4] == b"LINE"
+    assert path.read_bytes() == CONTENT
+
+    async with aiofiles.mmap_open(path, "r+") as m:
+        m[0:4] = b"LINE"
+        await m.flush()
+    assert path.read_bytes() == b"LINE" + CONTENT[4:]
+
+
+@pytest.mark.parametrize(
+    ("offset", "length"),
+    [(0, None), (1, 10), (mmap.PAGESIZE + 1, 3 * mmap.PAGESIZE), (10**9, 10)],
+)
+async def test_prefetch(path, offset, length):
+    """Prefetching works for any range, even unaligned or out of bounds."""
+    async with aiofiles.mmap_open(str(path)) as m:
+        await m.prefetch(offset, length)
+        assert m[:] == CONTENT
+
+
+async def test_errors(path, tmp_path):
+    """Bad modes, missing and empty files are rejected."""
+    with pytest.raises(ValueError):
+        aiofiles.mmap_open(path, "w")
+    with pytest.raises(FileNotFoundError):
+        await aiofiles.mmap_open(tmp_path / "missing")
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        await aiofiles.mmap_open(empty)
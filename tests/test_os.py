@@ -3,6 +3,8 @@
 import asyncio
 import os
 import platform
+import subprocess
+import sys
 from os import stat
 from os.path import dirname, exists, isdir, join
 from pathlib import Path
@@ -142,6 +144,22 @@ async def test_sendfile_file(tmpdir):
     assert size == actual_size
 
 
+@pytest.mark.skipif(
+    not hasattr(os, "copy_file_range"), reason="No copy_file_range() here"
+)
+async def test_copy_file_range(tmp_path):
+    """Test the copy_file_range call."""
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"0123456789")
+    dst = tmp_path / "dst.bin"
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        copied = await aiofiles.os.copy_file_range(fsrc.fileno(), fdst.fileno(), 4)
+
+    assert copied == 4
+    assert dst.read_bytes() == b"0123"
+
+
 @pytest.mark.skipif(
     platform.system() in ("Windows"), reason="sendfile() doesn't work on Win"
 )
@@ -183,6 +201,14 @@ async def test_exists():
     assert result
 
 
+async def test_exists_many():
+    """Test path.exists_many call."""
+    filename = join(dirname(__file__), "resources", "test_file1.txt")
+    missing = join(dirname(__file__), "resources", "missing.txt")
+    result = await aiofiles.os.path.exists_many([filename, missing, filename])
+    assert result == [True, False, True]
+
+
 async def test_isfile():
     """Test path.isfile call."""
     filename = join(dirname(__file__), "resources", "test_file1.txt")
@@ -220,6 +246,15 @@ async def test_getsize():
     assert result == 10
 
 
+async def test_getsize_many():
+    """Test path.getsize_many call."""
+    filename = join(dirname(__file__), "resources", "test_file1.txt")
+    missing = join(dirname(__file__), "resources", "missing.txt")
+    result = await aiofiles.os.path.getsize_many([filename, missing])
+    assert result[0] == 10
+    assert isinstance(result[1], FileNotFoundError)
+
+
 async def test_samefile():
     """Test path.samefile call."""
     filename = join(dirname(__file__), "resources", "test_file1.txt")
@@ -418,6 +453,46 @@ async def test_scandir_dir_with_only_one_dir():
     await aiofiles.os.rmdir(some_dir)
 
 
+@pytest.mark.parametrize("batch_size", [1, 7, 1000])
+async def test_scandir_async_iteration(tmp_path, batch_size):
+    """Test iterating over scandir asynchronously, in batches."""
+    names = {f"file_{i}" for i in range(50)}
+    for name in names:
+        (tmp_path / name).write_text(name)
+
+    entries = [
+        entry async for entry in aiofiles.os.scandir(tmp_path, batch_size=batch_size)
+    ]
+
+    assert {entry.name for entry in entries} == names
+    assert all(entry.is_file() for entry in entries)
+
+
+async def test_scandir_async_close(tmp_path):
+    """Test closing an async scandir iterator early."""
+    for i in range(10):
+        (tmp_path / str(i)).mkdir()
+
+    async with aiofiles.os.scandir(str(tmp_path), batch_size=2) as entries:
+        async for entry in entries:
+            assert entry.is_dir()
+            break
+
+    assert [entry async for entry in entries] == []
+
+    async with aiofiles.os.scandir(str(tmp_path)) as entries:
+        pass
+
+
+async def test_scandir_async_errors(tmp_path):
+    """Test errors of async scandir iteration."""
+    with pytest.raises(FileNotFoundError):
+        async for _ in aiofiles.os.scandir(tmp_path / "missing"):
+            pass
+    with pytest.raises(ValueError):
+        aiofiles.os.scandir(tmp_path, batch_size=0)
+
+
 async def test_scandir_non_existing_dir():
     """Test the scandir call when the dir doesn't exist."""
     some_dir = join(dirname(__file__), "resources", "some_dir")
@@ -498,3 +573,170 @@ async def test_abspath():
     abs_filename = join(dirname(__file__), "resources", "test_file1.txt")
     result = await aiofiles.os.path.abspath(relative_filename)
     assert result == abs_filename
+
+
+def _make_tree(root):
+    """Make a small directory tree, returning what os.walk makes of it."""
+    for directory in ["a/b/c", "a/d", "e", "f/g/h/i"]:
+        (root / directory).mkdir(parents=True)
+    for file in ["x", "a/y", "a/b/c/z", "f/g/h/i/w", "e/v"]:
+        (root / file).write_text(file)
+    return sorted(
+        (dirpath, sorted(dirnames), sorted(filenames))
+        for dirpath, dirnames, filenames in os.walk(root)
+    )
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 8])
+@pytest.mark.parametrize("topdown", [True, False])
+async def test_walk(tmp_path, concurrency, topdown):
+    """Test the walk call."""
+    expected = _make_tree(tmp_path)
+    actual = []
+
+    async for dirpath, dirs, files in aiofiles.os.walk(
+        str(tmp_path), topdown=topdown, concurrency=concurrency
+    ):
+        actual.append((dirpath, dirs, files))
+
+    assert (
+        sorted(
+            (
+                dirpath,
+                sorted(entry.name for entry in dirs),
+                sorted(entry.name for entry in files),
+            )
+            for dirpath, dirs, files in actual
+        )
+        == expected
+    )
+    for dirpath, dirs, files in actual:
+        for entry in dirs:
+            assert isinstance(entry, os.DirEntry)
+            assert entry.path == os.path.join(dirpath, entry.name)
+            assert entry.is_dir()
+        for entry in files:
+            assert entry.is_file()
+
+    # Parents come before (or after) their subdirectories.
+    order = [dirpath for dirpath, _, _ in actual]
+    for dirpath in order:
+        parent = os.path.dirname(dirpath)
+        if parent in order:
+            if topdown:
+                assert order.index(parent) < order.index(dirpath)
+            else:
+                assert order.index(parent) > order.index(dirpath)
+
+
+async def test_walk_pruning(tmp_path):
+    """Removing directories from dirs prunes them when walking top down."""
+    _make_tree(tmp_path)
+    visited = []
+
+    async for dirpath, dirs, _ in aiofiles.os.walk(tmp_path):
+        visited.append(os.path.relpath(dirpath, tmp_path))
+        dirs[:] = [entry for entry in dirs if entry.name != "a"]
+
+    assert sorted(visited) == [".", "e", "f", "f/g", "f/g/h", "f/g/h/i"]
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Needs symlinks")
+async def test_walk_symlinks(tmp_path):
+    """Symlinks to directories are only followed when asked to."""
+    _make_tree(tmp_path)
+    (tmp_path / "e" / "link").symlink_to(tmp_path / "a" / "b")
+
+    visited = [dirpath async for dirpath, _, _ in aiofiles.os.walk(tmp_path)]
+    assert os.path.join(tmp_path, "e", "link") not in visited
+
+    visited = [
+        dirpath async for dirpath, _, _ in aiofiles.os.walk(tmp_path, followlinks=True)
+    ]
+    assert os.path.join(tmp_path, "e", "link", "c") in visited
+
+
+async def test_walk_errors(tmp_path):
+    """Errors are passed to onerror, and bad arguments are rejected."""
+    errors = []
+
+    async for _ in aiofiles.os.walk(tmp_path / "missing", onerror=errors.append):
+        pytest.fail("Nothing to walk.")
+
+    assert len(errors) == 1
+    assert isinstance(errors[0], FileNotFoundError)
+
+    with pytest.raises(ValueError):
+        async for _ in aiofiles.os.walk(tmp_path, concurrency=0):
+            pass
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+@pytest.mark.parametrize("chunk_size", [1, 4, 100])
+async def test_stat_many(tmp_path, concurrency, chunk_size):
+    """Test the stat_many call."""
+    paths = []
+    for i in range(20):
+        path = tmp_path / str(i)
+        if i % 3:
+            path.write_bytes(b"x" * i)
+        paths.append(path)
+
+    results = await aiofiles.os.stat_many(
+        paths, concurrency=concurrency, chunk_size=chunk_size
+    )
+
+    assert len(results) == 20
+    for i, result in enumerate(results):
+        if i % 3:
+            assert result.st_size == i
+        else:
+            assert isinstance(result, FileNotFoundError)
+            assert result.filename == str(paths[i])
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Needs symlinks")
+async def test_stat_many_follow_symlinks(tmp_path):
+    """Test the stat_many call, passing arguments to stat."""
+    (tmp_path / "file").write_bytes(b"content")
+    (tmp_path / "link").symlink_to(tmp_path / "file")
+
+    [followed] = await aiofiles.os.stat_many([tmp_path / "link"])
+    [not_followed] = await aiofiles.os.stat_many(
+        [tmp_path / "link"], follow_symlinks=False
+    )
+
+    assert followed.st_size == 7
+    assert not_followed.st_ino != followed.st_ino
+
+
+async def test_stat_many_edge_cases(tmp_path):
+    """Test the stat_many call with no paths, and bad arguments."""
+    assert await aiofiles.os.stat_many([]) == []
+    assert await aiofiles.os.stat_many(iter([tmp_path])) == [os.stat(tmp_path)]
+
+    with pytest.raises(ValueError):
+        await aiofiles.os.stat_many([tmp_path], concurrency=0)
+    with pytest.raises(ValueError):
+        await aiofiles.os.stat_many([tmp_path], chunk_size=0)
+
+
+@pytest.mark.skipif(
+    not hasattr(aiofiles.os, "sync_file_range"),
+    reason="No sync_file_range on this platform",
+)
+async def test_sync_file_range(tmp_path):
+    """The C library is only loaded once sync_file_range is called."""
+    code = "import sys, aiofiles, aiofiles.os; print('ctypes' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    assert result.stdout.strip() == "False"
+
+    path = tmp_path / "file"
+    path.write_bytes(b"data")
+    fd = os.open(path, os.O_RDWR)
+    try:
+        await aiofiles.os.sync_file_range(fd, 0, 0, aiofiles.os.SYNC_FILE_RANGE_WRITE)
+    finally:
+        os.close(fd)
@@ -0,0 +1,74 @@
+"""Tests for reading files with several workers."""
+
+from collections import deque
+
+import pytest
+
+import aiofiles
+from aiofiles import parallel
+
+
+@pytest.mark.parametrize("workers", [1, 3, 16])
+@pytest.mark.parametrize("chunk_size", [1, 100, 1024, 1 << 20])
+async def test_read_parallel(tmp_path, workers, chunk_size):
+    """The whole file is read, in order."""
+    path = tmp_path / "file.bin"
+    content = bytes(range(256)) * 40 + b"tail"
+    path.write_bytes(content)
+
+    result = await aiofiles.read_parallel(path, workers=workers, chunk_size=chunk_size)
+
+    assert isinstance(result, bytearray)
+    assert result == content
+
+
+async def test_read_parallel_empty(tmp_path):
+    """Empty files are read without any workers."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"")
+
+    assert await aiofiles.read_parallel(str(path)) == b""
+
+
+async def test_read_parallel_errors(tmp_path):
+    """Errors are raised, and bad arguments are rejected."""
+    with pytest.raises(FileNotFoundError):
+        await aiofiles.read_parallel(tmp_path / "missing")
+    with pytest.raises(IsADirectoryError):
+        await aiofiles.read_parallel(tmp_path)
+    with pytest.raises(ValueError):
+        await aiofiles.read_parallel(tmp_path, workers=0)
+    with pytest.raises(ValueError):
+        await aiofiles.read_parallel(tmp_path, chunk_size=0)
+
+
+async def test_read_parallel_shrunk(tmp_path, monkeypatch):
+    """If the file shrinks while being read, the result is cut short."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"0123456789")
+
+    class Stat:
+        st_size = 25
+
+    monkeypatch.setattr(parallel.os, "stat", lambda path: Stat())
+
+    assert await aiofiles.read_parallel(path, chunk_size=4) == b"0123456789"
+
+
+def test_stopped_workers_read_nothing(tmp_path):
+    """Workers stop picking up ranges once told to stop."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"x" * 100)
+    result = bytearray(100)
+    ranges = deque([(0, 50), (50, 50)])
+    state = parallel._ReadState(100)
+
+    parallel._read_ranges(path, memoryview(result), ranges, state)
+    assert result == b"x" * 100
+
+    result = bytearray(100)
+    ranges = deque([(0, 50), (50, 50)])
+    state.stop.set()
+    parallel._read_ranges(path, memoryview(result), ranges, state)
+    assert result == bytes(100)
+    assert len(ranges) == 2
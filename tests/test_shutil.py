@@ -0,0 +1,96 @@
+"""Tests for asyncio's shutil module."""
+
+import os
+import platform
+import stat
+
+import pytest
+
+import aiofiles.shutil
+
+CONTENT = b"0123456789" * 1000
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "src.bin"
+    path.write_bytes(CONTENT)
+    path.chmod(0o640)
+    os.utime(path, (1_000_000, 1_000_000))
+    return path
+
+
+async def test_copyfile(src, tmp_path):
+    """Test the copyfile call."""
+    dst = tmp_path / "dst.bin"
+
+    assert await aiofiles.shutil.copyfile(src, dst) == dst
+
+    assert dst.read_bytes() == CONTENT
+    assert dst.stat().st_mtime != 1_000_000
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Needs symlinks")
+async def test_copyfile_symlink(src, tmp_path):
+    """Test the copyfile call with a symlink."""
+    link = tmp_path / "link"
+    link.symlink_to(src)
+    dst = tmp_path / "dst.bin"
+
+    await aiofiles.shutil.copyfile(link, dst, follow_symlinks=False)
+
+    assert dst.is_symlink()
+    assert os.readlink(dst) == str(src)
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Unix modes")
+async def test_copy(src, tmp_path):
+    """Test the copy call, into a directory."""
+    dst_dir = tmp_path / "dir"
+    dst_dir.mkdir()
+
+    dst = await aiofiles.shutil.copy(str(src), str(dst_dir))
+
+    assert dst == str(dst_dir / "src.bin")
+    assert (dst_dir / "src.bin").read_bytes() == CONTENT
+    assert stat.S_IMODE(os.stat(dst).st_mode) == 0o640
+    assert os.stat(dst).st_mtime != 1_000_000
+
+
+async def test_copy2(src, tmp_path):
+    """Test the copy2 call."""
+    dst = tmp_path / "dst.bin"
+
+    assert await aiofiles.shutil.copy2(src, dst) == dst
+
+    assert dst.read_bytes() == CONTENT
+    assert dst.stat().st_mtime == 1_000_000
+
+
+async def test_copytree(src, tmp_path):
+    """Test the copytree call."""
+    tree = tmp_path / "tree"
+    (tree / "sub").mkdir(parents=True)
+    (tree / "a.bin").write_bytes(CONTENT)
+    (tree / "sub" / "b.bin").write_bytes(b"b")
+    (tree / "sub" / "ignored.txt").write_bytes(b"c")
+    dst = tmp_path / "copy"
+
+    result = await aiofiles.shutil.copytree(
+        tree, dst, ignore=aiofiles.shutil.shutil.ignore_patterns("*.txt")
+    )
+
+    assert result == dst
+    assert (dst / "a.bin").read_bytes() == CONTENT
+    assert (dst / "sub" / "b.bin").read_bytes() == b"b"
+    assert not (dst / "sub" / "ignored.txt").exists()
+
+    with pytest.raises(FileExistsError):
+        await aiofiles.shutil.copytree(tree, dst)
+    await aiofiles.shutil.copytree(tree, dst, dirs_exist_ok=True)
+
+
+async def test_copyfile_missing(tmp_path):
+    """Copying a missing file fails."""
+    with pytest.raises(FileNotFoundError):
+        await aiofiles.shutil.copyfile(tmp_path / "missing", tmp_path / "dst")
@@ -0,0 +1,129 @@
+"""Tests for the stat cache."""
+
+import os
+
+import pytest
+
+import aiofiles.os
+import aiofiles.statcache
+
+
+@pytest.fixture
+def cache():
+    cache = aiofiles.statcache.enable_stat_cache(ttl=60)
+    yield cache
+    aiofiles.statcache.disable_stat_cache()
+
+
+async def test_disabled_by_default(tmp_path):
+    """Without a cache, every call goes to the file system."""
+    assert aiofiles.statcache.get_stat_cache() is None
+    path = tmp_path / "file"
+    path.write_bytes(b"a")
+    assert await aiofiles.os.path.getsize(path) == 1
+    path.write_bytes(b"ab")
+    assert await aiofiles.os.path.getsize(path) == 2
+
+
+async def test_stat_hits_and_misses(tmp_path, cache):
+    """Repeated stats are answered from the cache."""
+    path = tmp_path / "file"
+    path.write_bytes(b"a")
+
+    first = await aiofiles.os.stat(path)
+    path.write_bytes(b"ab")
+    second = await aiofiles.os.stat(str(path))
+
+    assert first == second
+    assert first.st_size == 1
+    assert cache.info() == aiofiles.statcache.CacheInfo(1, 1, 4096, 1)
+
+    cache.invalidate(path)
+    assert (await aiofiles.os.stat(path)).st_size == 2
+    assert cache.info().misses == 2
+
+
+async def test_predicates(tmp_path, cache):
+    """The os.path predicates share cached stat results."""
+    path = tmp_path / "file"
+    path.write_bytes(b"abc")
+    (tmp_path / "link").symlink_to(path)
+
+    assert await aiofiles.os.path.exists(path)
+    assert await aiofiles.os.path.isfile(path)
+    assert not await aiofiles.os.path.isdir(path)
+    assert await aiofiles.os.path.getsize(path) == 3
+    assert await aiofiles.os.path.getmtime(path) == os.path.getmtime(path)
+    assert await aiofiles.os.path.isdir(tmp_path)
+    assert await aiofiles.os.path.islink(tmp_path / "link")
+    assert not await aiofiles.os.path.islink(path)
+
+    info = cache.info()
+    assert info.misses == 4  # The file, the directory, the link and its lstat.
+    assert info.hits == 4
+
+
+async def test_missing_files(tmp_path, cache):
+    """Errors are cached too, and raised afresh every time."""
+    path = tmp_path / "missing"
+
+    assert not await aiofiles.os.path.exists(path)
+    assert not await aiofiles.os.path.isfile(path)
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError) as exc_info:
+            await aiofiles.os.path.getsize(path)
+        assert exc_info.value.filename == str(path)
+    assert cache.info().misses == 1
+
+    path.write_bytes(b"")
+    assert not await aiofiles.os.path.exists(path)
+    cache.clear()
+    assert await aiofiles.os.path.exists(path)
+    assert cache.info() == aiofiles.statcache.CacheInfo(0, 1, 4096, 1)
+
+
+async def test_expiry_and_eviction(tmp_path, monkeypatch):
+    """Entries expire after the TTL, and the oldest are evicted."""
+    now = [0.0]
+    monkeypatch.setattr(aiofiles.statcache.time, "monotonic", lambda: now[0])
+    cache = aiofiles.statcache.StatCache(maxsize=2, ttl=1.0)
+    paths = [tmp_path / str(i) for i in range(3)]
+    for path in paths:
+        path.write_bytes(b"")
+
+    await cache.stat(paths[0])
+    now[0] = 0.5
+    await cache.stat(paths[0])
+    assert cache.info().hits == 1
+    now[0] = 1.0
+    await cache.stat(paths[0])
+    assert cache.info().misses == 2
+
+    await cache.stat(paths[1])
+    await cache.stat(paths[2])
+    assert cache.info().currsize == 2
+    await cache.stat(paths[0])
+    assert cache.info().misses == 5
+
+
+async def test_uncacheable_calls(tmp_path, cache):
+    """Calls on file descriptors or relative to directories bypass the cache."""
+    path = tmp_path / "file"
+    path.write_bytes(b"a")
+    dir_fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        result = await aiofiles.os.stat("file", dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+    with path.open("rb") as f:
+        assert await aiofiles.os.stat(f.fileno()) == result
+        assert await aiofiles.os.path.exists(f.fileno())
+    assert cache.info().currsize == 0
+
+
+def test_invalid_settings():
+    """The size and TTL must be positive."""
+    with pytest.raises(ValueError, match="maxsize"):
+        aiofiles.statcache.StatCache(maxsize=0)
+    with pytest.raises(ValueError, match="ttl"):
+        aiofiles.statcache.StatCache(ttl=0)
@@ -0,0 +1,161 @@
+"""Tests for copying files and sending them to transports."""
+
+import asyncio
+import errno
+import os
+import shutil
+import threading
+
+import pytest
+
+import aiofiles
+from aiofiles import transfer
+
+CONTENT = bytes(range(256)) * 100
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = tmp_path / "src.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.mark.parametrize(
+    "method", transfer._COPY_METHODS, ids=lambda method: method.__name__
+)
+async def test_copyfile(src, tmp_path, monkeypatch, method):
+    """Files are copied with every available method."""
+    dst = tmp_path / "dst.bin"
+    dst.write_bytes(b"previous content, longer than nothing")
+    # Reflinks aren't supported by every file system.
+    monkeypatch.setattr(transfer, "_COPY_METHODS", [method, transfer._read_write])
+    progress = []
+
+    result = await aiofiles.copyfile(
+        src, dst, chunk_size=10_000, progress=progress.append
+    )
+    await asyncio.sleep(0)  # Progress is reported via the loop.
+
+    assert result == dst
+    assert dst.read_bytes() == CONTENT
+    assert progress in ([10_000, 20_000, 25_600], [25_600])
+
+
+async def test_copyfile_empty(tmp_path):
+    """Empty files are copied."""
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"")
+    dst = tmp_path / "dst.bin"
+
+    await aiofiles.copyfile(str(src), str(dst))
+
+    assert dst.read_bytes() == b""
+
+
+async def test_copyfile_falls_back(src, tmp_path, monkeypatch):
+    """Unsupported methods are skipped, other errors are raised."""
+    dst = tmp_path / "dst.bin"
+
+    def unsupported(src_fd, dst_fd, chunk_size):
+        raise OSError(errno.EXDEV, "Nope")
+        yield
+
+    def copies_nothing(src_fd, dst_fd, chunk_size):
+        yield from ()
+
+    monkeypatch.setattr(
+        transfer,
+        "_COPY_METHODS",
+        [unsupported, copies_nothing, transfer._read_write],
+    )
+    await aiofiles.copyfile(src, dst)
+    assert dst.read_bytes() == CONTENT
+
+    def broken(src_fd, dst_fd, chunk_size):
+        raise OSError(errno.EIO, "Broken")
+        yield
+
+    monkeypatch.setattr(transfer, "_COPY_METHODS", [broken, transfer._read_write])
+    with pytest.raises(OSError) as exc_info:
+        await aiofiles.copyfile(src, dst)
+    assert exc_info.value.errno == errno.EIO
+
+
+async def test_copyfile_errors(src, tmp_path):
+    """Copying a file onto itself or a missing file fails."""
+    with pytest.raises(shutil.SameFileError):
+        await aiofiles.copyfile(src, src)
+    assert src.read_bytes() == CONTENT
+
+    with pytest.raises(FileNotFoundError):
+        await aiofiles.copyfile(tmp_path / "missing", tmp_path / "dst")
+    assert not (tmp_path / "dst").exists()
+
+
+async def test_copyfile_cancel(src, tmp_path, monkeypatch):
+    """Cancelling stops the copy after the current chunk."""
+    dst = tmp_path / "dst.bin"
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(src_fd, dst_fd, chunk_size):
+        for _ in range(10):
+            os.write(dst_fd, os.read(src_fd, chunk_size))
+            started.set()
+            release.wait()
+            yield chunk_size
+
+    monkeypatch.setattr(transfer, "_COPY_METHODS", [slow])
+    task = asyncio.ensure_future(aiofiles.copyfile(src, dst, chunk_size=100))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait)
+    task.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert dst.read_bytes() == CONTENT[:100]
+
+
+@pytest.mark.parametrize("count", [None, 10_000])
+async def test_send_to_transport(src, unused_tcp_port, count):
+    """Files are sent to stream writers."""
+    progress = []
+    results = []
+
+    async def serve_file(reader, writer):
+        async with aiofiles.open(src, "rb") as f:
+            results.append(
+                await aiofiles.send_to_transport(
+                    f, writer, count=count, chunk_size=4096, progress=progress.append
+                )
+            )
+        writer.close()
+
+    server = await asyncio.start_server(serve_file, port=unused_tcp_port)
+    reader, writer = await asyncio.open_connection(port=unused_tcp_port)
+    payload = await reader.read()
+    writer.close()
+    server.close()
+    await server.wait_closed()
+
+    expected = CONTENT if count is None else CONTENT[:count]
+    assert payload == expected
+    assert results == [len(expected)]
+    assert progress[-1] == len(expected)
+    assert all(b - a <= 4096 for a, b in zip([0, *progress], progress))
+
+
+@pytest.mark.skipif(
+    transfer._ficlone not in transfer._COPY_METHODS, reason="No reflinks"
+)
+def test_ficlone_needs_whole_files(src, tmp_path):
+    """Reflinks are only attempted for whole files."""
+    dst = tmp_path / "dst.bin"
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fsrc.seek(1)
+        with pytest.raises(OSError) as exc_info:
+            list(transfer._ficlone(fsrc.fileno(), fdst.fileno(), 1024))
+
+    assert exc_info.value.errno == errno.EINVAL
@@ -0,0 +1,109 @@
+"""Tests for the slow operation watchdog."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+import pytest
+
+import aiofiles
+import aiofiles.threadpool
+import aiofiles.watchdog
+from aiofiles.base import wrap
+
+
+@pytest.fixture
+def reports():
+    reports = []
+    aiofiles.watchdog.enable_watchdog(0.05, callback=reports.append, interval=0.01)
+    yield reports
+    aiofiles.watchdog.disable_watchdog()
+
+
+@pytest.fixture
+def slow_open(monkeypatch):
+    sync_open = aiofiles.threadpool.sync_open
+
+    @wraps(sync_open)
+    def slow(*args, **kwargs):
+        time.sleep(0.2)
+        return sync_open(*args, **kwargs)
+
+    monkeypatch.setattr(aiofiles.threadpool, "sync_open", slow)
+
+
+async def test_slow_operation(tmp_path, reports, slow_open):
+    """Slow operations are reported once, with the awaiting task's stack."""
+    path = tmp_path / "file"
+    path.write_bytes(b"")
+
+    async with aiofiles.open(path, "rb") as f:
+        await f.read()
+
+    assert len(reports) == 1
+    report = reports[0]
+    assert report.name == "open"
+    assert report.path == str(path)
+    assert report.elapsed >= 0.05
+    assert report.task is asyncio.current_task()
+    assert "test_slow_operation" in report.stack
+
+
+async def test_fast_operations(tmp_path, reports):
+    """Fast operations aren't reported."""
+    async with aiofiles.open(tmp_path / "file", "wb") as f:
+        await f.write(b"data")
+    await asyncio.sleep(0.1)
+    assert reports == []
+
+
+async def test_log(tmp_path, caplog, slow_open):
+    """Without a callback, slow operations are logged."""
+    aiofiles.watchdog.enable_watchdog(0.05, interval=0.01)
+    try:
+        with caplog.at_level(logging.WARNING, logger="aiofiles.watchdog"):
+            await aiofiles.open(tmp_path / "file", "wb")
+    finally:
+        aiofiles.watchdog.disable_watchdog()
+
+    assert len(caplog.records) == 1
+    assert "aiofiles operation open on" in caplog.records[0].getMessage()
+
+
+async def test_in_flight(reports):
+    """Operations in flight are counted by executor."""
+    watchdog = aiofiles.watchdog.get_watchdog()
+    executor = ThreadPoolExecutor(1)
+    release = threading.Event()
+    wait = wrap(release.wait)
+    jobs = [asyncio.ensure_future(wait(executor=executor)) for _ in range(2)]
+    try:
+        await asyncio.sleep(0.01)
+        assert watchdog.in_flight() == {executor: aiofiles.watchdog.InFlight(1, 1)}
+    finally:
+        release.set()
+        await asyncio.gather(*jobs)
+        executor.shutdown()
+    assert watchdog.in_flight() == {}
+
+
+async def test_disable(tmp_path, slow_open):
+    """No reports come once disabled."""
+    reports = []
+    aiofiles.watchdog.enable_watchdog(0.05, callback=reports.append, interval=0.01)
+    aiofiles.watchdog.disable_watchdog()
+    assert aiofiles.watchdog.get_watchdog() is None
+
+    await aiofiles.open(tmp_path / "file", "wb")
+
+    assert reports == []
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        aiofiles.watchdog.Watchdog(0)
+    with pytest.raises(ValueError):
+        aiofiles.watchdog.Watchdog(1, interval=0)
@@ -0,0 +1,121 @@
+"""Tests for batching delegated calls on the same file."""
+
+import asyncio
+import os
+import select
+import threading
+
+import pytest
+
+import aiofiles.executor
+from aiofiles.threadpool import open as aioopen
+
+
+async def test_ordering(tmp_path):
+    """With ordering, concurrently issued writes run in the order issued."""
+    path = tmp_path / "file.txt"
+
+    async with aioopen(path, "w") as f:
+        f.enable_ordering()
+        await asyncio.gather(*(f.write(f"{i}\n") for i in range(1000)))
+
+    assert path.read_text() == "".join(f"{i}\n" for i in range(1000))
+
+
+async def test_calls_are_coalesced(tmp_path, monkeypatch):
+    """Calls queued behind a running job don't need jobs of their own."""
+    path = tmp_path / "file.bin"
+    jobs = 0
+    run_in_executor = aiofiles.executor.run_in_executor
+
+    def counting_run_in_executor(loop, executor, func):
+        nonlocal jobs
+        jobs += 1
+        return run_in_executor(loop, executor, func)
+
+    async with aioopen(path, "wb") as f:
+        monkeypatch.setattr(
+            aiofiles.executor, "run_in_executor", counting_run_in_executor
+        )
+        results = await asyncio.gather(*(f.write(b"x") for _ in range(100)))
+        monkeypatch.undo()
+
+    assert results == [1] * 100
+    assert path.read_bytes() == b"x" * 100
+    assert jobs < 100
+
+
+async def test_errors_are_isolated(tmp_path):
+    """A failing call doesn't affect the calls batched with it."""
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"0123456789")
+
+    async with aioopen(path, "rb") as f:
+        results = await asyncio.gather(
+            f.read(2), f.seek(-1), f.read(2), return_exceptions=True
+        )
+
+    assert results[0] == b"01"
+    assert isinstance(results[1], OSError)
+    assert results[2] == b"23"
+
+
+async def test_cancelled_calls_are_skipped(tmp_path):
+    """Calls cancelled while waiting in the queue aren't run."""
+    path = tmp_path / "file.bin"
+    started = threading.Event()
+    release = threading.Event()
+
+    async with aioopen(path, "wb") as f:
+        # Otherwise the second write isn't queued behind the first.
+        f.enable_ordering()
+        original = f._file.write
+
+        def slow_write(data):
+            started.set()
+            release.wait()
+            return original(data)
+
+        f._file.write = slow_write
+        first = asyncio.ensure_future(f.write(b"first"))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        second = asyncio.ensure_future(f.write(b"second"))
+        await asyncio.sleep(0)
+        second.cancel()
+        release.set()
+
+        assert await first == 5
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        await f.flush()
+
+    assert path.read_bytes() == b"first"
+
+
+@pytest.mark.skipif(not hasattr(os, "openpty"), reason="Needs a pty")
+async def test_full_duplex():
+    """A blocked read doesn't hold back writes on the same file."""
+    controller, terminal = os.openpty()
+
+    def peer():
+        # Answer the ping, giving up after a while so the test can't hang.
+        data = b""
+        while b"ping" not in data:
+            if not select.select([controller], [], [], 5)[0]:
+                break
+            data += os.read(controller, 1024)
+        os.write(controller, b"pong\n")
+
+    loop = asyncio.get_running_loop()
+    answered = loop.run_in_executor(None, peer)
+    try:
+        async with aioopen(os.ttyname(terminal), "r+b", buffering=0) as f:
+            reply = asyncio.ensure_future(f.read(5))
+            # Have the read block first.
+            await asyncio.sleep(0.05)
+            await asyncio.wait_for(f.write(b"ping\n"), 2)
+            assert await reply == b"pong\n"
+    finally:
+        await answered
+        os.close(controller)
+        os.close(terminal)
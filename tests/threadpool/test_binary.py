@@ -1,10 +1,13 @@
 """PEP 0492/Python 3.5+ tests for binary files."""
 
+import asyncio
 import io
+import os
 from os.path import dirname, join
 
 import pytest
 
+import aiofiles.os
 from aiofiles.threadpool import open as aioopen
 
 
@@ -37,6 +40,34 @@ async def test_simple_iteration(mode, buffering):
     assert file.closed
 
 
+@pytest.mark.parametrize("mode", ["rb", "rb+", "ab+"])
+@pytest.mark.parametrize("buffering", [-1, 0])
+async def test_chunked_iteration(mode, buffering):
+    """Test iterating over lines from a file, a chunk at a time."""
+    filename = join(dirname(__file__), "..", "resources", "multiline_file.txt")
+
+    async with aioopen(filename, mode=mode, buffering=buffering) as file:
+        # Append mode needs us to seek.
+        await file.seek(0)
+
+        counter = 1
+        async for line in file.iter_lines(chunk_size=8):
+            assert line.strip() == b"line " + str(counter).encode()
+            counter += 1
+
+        assert counter == 5
+
+        await file.seek(0)
+        async for line in file.iter_lines():
+            assert line.strip().endswith(b"1")
+            break
+
+        # The whole (small) file was fetched at once.
+        assert await file.read() == b""
+
+    assert file.closed
+
+
 @pytest.mark.parametrize("mode", ["rb", "rb+", "ab+"])
 @pytest.mark.parametrize("buffering", [-1, 0])
 async def test_simple_readlines(mode, buffering):
@@ -321,3 +352,72 @@ async def test_mode_property(mode, buffering):
         assert file.mode == mode
 
     assert file.closed
+
+
+@pytest.mark.skipif(not hasattr(os, "pread"), reason="No pread on this platform")
+async def test_positional_io(tmpdir):
+    """Test positional reads and writes, issued concurrently."""
+    full_file = tmpdir.join("file.bin")
+    full_file.write_binary(b"x" * 1000)
+
+    async with aioopen(str(full_file), mode="rb+", buffering=0) as file:
+        await file.seek(10)
+
+        written = await asyncio.gather(
+            *(file.pwrite(bytes([i]) * 100, i * 100) for i in range(10))
+        )
+        assert written == [100] * 10
+
+        chunks = await asyncio.gather(*(file.pread(100, i * 100) for i in range(10)))
+        assert chunks == [bytes([i]) * 100 for i in range(10)]
+
+        buf = bytearray(150)
+        assert await file.preadinto(buf, 50) == 150
+        assert buf == b"\x00" * 50 + b"\x01" * 100
+
+        assert await file.pread(100, 990) == b"\x09" * 10
+        assert await file.pread(100, 1000) == b""
+
+        # The file position is untouched.
+        assert await file.tell() == 10
+
+    assert full_file.read_binary() == b"".join(bytes([i]) * 100 for i in range(10))
+
+
+@pytest.mark.parametrize("buffering", [-1, 0])
+async def test_sync_methods(tmpdir, buffering):
+    """Test syncing, with buffered data flushed first."""
+    filename = str(tmpdir.join("file.bin"))
+
+    async with aioopen(filename, mode="wb", buffering=buffering) as file:
+        await file.write(b"data")
+        await file.fsync()
+        assert os.path.getsize(filename) == 4
+
+        if hasattr(os, "fdatasync"):
+            await file.write(b"more")
+            await file.fdatasync()
+            assert os.path.getsize(filename) == 8
+
+        if hasattr(aiofiles.os, "sync_file_range"):
+            await file.write(b"range")
+            await file.sync_file_range()
+            assert os.path.getsize(filename) == 13
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "posix_fallocate"), reason="No posix_fallocate on this platform"
+)
+@pytest.mark.parametrize("buffering", [-1, 0])
+async def test_allocation_methods(tmpdir, buffering):
+    """Test preallocating space and giving access advice."""
+    filename = str(tmpdir.join("file.bin"))
+
+    async with aioopen(filename, mode="wb", buffering=buffering) as file:
+        await file.fallocate(0, 4096)
+        assert os.path.getsize(filename) == 4096
+        await file.fadvise(0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        await file.close()
+        with pytest.raises(ValueError):
+            await file.fsync()
@@ -0,0 +1,116 @@
+"""Tests for the nowait engine."""
+
+import os
+
+import pytest
+
+import aiofiles.threadpool
+from aiofiles.threadpool import open as aioopen
+from aiofiles.threadpool.binary import (
+    NOWAIT_AVAILABLE,
+    AsyncFileIO,
+    AsyncNowaitFileIO,
+)
+
+pytestmark = pytest.mark.skipif(
+    not NOWAIT_AVAILABLE, reason="RWF_NOWAIT is not available"
+)
+
+
+@pytest.fixture
+def cached_file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(bytes(range(256)) * 16)
+    # Reading it makes sure it is in the page cache.
+    path.read_bytes()
+    return path
+
+
+async def test_engine_selection(cached_file):
+    """Only unbuffered binary files use the nowait engine."""
+    async with aioopen(cached_file, "rb", buffering=0, engine="nowait") as f:
+        assert type(f) is AsyncNowaitFileIO
+    async with aioopen(cached_file, "rb", buffering=0) as f:
+        assert type(f) is AsyncFileIO
+    async with aioopen(cached_file, "rb", engine="nowait") as f:
+        assert not isinstance(f, AsyncFileIO)
+
+    with pytest.raises(ValueError):
+        aioopen(cached_file, "rb", engine="nope")
+
+
+async def test_default_engine(cached_file):
+    """The default engine can be switched globally."""
+    assert aiofiles.threadpool.get_default_engine() == "thread"
+    aiofiles.threadpool.set_default_engine("nowait")
+    try:
+        async with aioopen(cached_file, "rb", buffering=0) as f:
+            assert type(f) is AsyncNowaitFileIO
+        async with aioopen(cached_file, "rb", buffering=0, engine="thread") as f:
+            assert type(f) is AsyncFileIO
+    finally:
+        aiofiles.threadpool.set_default_engine("thread")
+
+    with pytest.raises(ValueError):
+        aiofiles.threadpool.set_default_engine("nope")
+
+
+async def test_cached_reads_skip_executor(cached_file, monkeypatch):
+    """Reads of cached data don't touch the executor."""
+    expected = cached_file.read_bytes()
+
+    async with aioopen(cached_file, "rb", buffering=0, engine="nowait") as f:
+
+        def fail(*args, **kwargs):
+            pytest.fail("Executor used.")
+
+        monkeypatch.setattr(f._loop, "run_in_executor", fail)
+
+        assert await f.read(10) == expected[:10]
+        buf = bytearray(20)
+        assert await f.readinto(buf) == 20
+        assert buf == expected[10:30]
+        assert await f.read(0) == b""
+        assert await f.pread(5, 100) == expected[100:105]
+        assert await f.preadinto(buf, 200) == 20
+        assert buf == expected[200:220]
+
+        monkeypatch.undo()
+
+        assert await f.tell() == 30
+        assert await f.read() == expected[30:]
+        assert await f.read(10) == b""
+
+
+async def test_uncached_reads_fall_back(cached_file, monkeypatch):
+    """Reads fall back to the executor if the data isn't cached."""
+
+    preadv = os.preadv
+
+    def would_block(fd, buffers, offset, flags=0):
+        if flags & os.RWF_NOWAIT:
+            raise BlockingIOError
+        return preadv(fd, buffers, offset, flags)
+
+    monkeypatch.setattr(os, "preadv", would_block)
+    expected = cached_file.read_bytes()
+
+    async with aioopen(cached_file, "rb", buffering=0, engine="nowait") as f:
+        assert await f.read(10) == expected[:10]
+        buf = bytearray(10)
+        assert await f.readinto(buf) == 10
+        assert buf == expected[10:20]
+        assert await f.pread(10, 100) == expected[100:110]
+        assert await f.preadinto(buf, 200) == 10
+        assert buf == expected[200:210]
+
+
+async def test_errors(cached_file):
+    """Errors are the same as with the thread engine."""
+    async with aioopen(cached_file, "wb", buffering=0, engine="nowait") as f:
+        await f.write(b"data")
+        with pytest.raises(OSError):
+            await f.read(4)
+
+    with pytest.raises(ValueError):
+        await f.read(4)
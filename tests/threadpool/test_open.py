@@ -3,6 +3,8 @@ from pathlib import Path
 
 import pytest
 
+import aiofiles
+import aiofiles.threadpool
 from aiofiles.threadpool import open as aioopen
 
 RESOURCES_DIR = Path(__file__).parent.parent / "resources"
@@ -67,3 +69,43 @@ async def test_filetask_async_context_aexit():
         assert task.cancelled
 
     assert file_ref.closed
+
+
+async def test_read_bytes_and_text():
+    """Whole files can be read in a single call."""
+    assert await aiofiles.read_bytes(TEST_FILE) == TEST_FILE_CONTENTS.encode()
+    assert await aiofiles.read_text(str(TEST_FILE)) == TEST_FILE_CONTENTS
+
+    with pytest.raises(FileNotFoundError):
+        await aiofiles.read_bytes(RESOURCES_DIR / "non_existent")
+
+
+async def test_write_bytes_and_text(tmp_path):
+    """Whole files can be written in a single call."""
+    path = tmp_path / "file"
+    assert await aiofiles.write_bytes(path, b"abc") == 3
+    assert path.read_bytes() == b"abc"
+    assert await aiofiles.write_bytes(path, bytearray(b"d")) == 1
+    assert path.read_bytes() == b"d"
+
+    assert await aiofiles.write_text(path, "ł\n", encoding="utf-8", newline="\r\n")
+    assert path.read_bytes() == "ł\r\n".encode()
+    assert await aiofiles.read_text(path, encoding="utf-8") == "ł\n"
+    assert await aiofiles.read_text(path, encoding="utf-8", newline="") == "ł\r\n"
+
+    with pytest.raises(TypeError, match="must be str"):
+        await aiofiles.write_text(path, b"abc")
+
+
+async def test_read_bytes_single_job(monkeypatch):
+    """Opening, reading and closing happen in a single executor job."""
+    jobs = []
+    run_in_executor = aiofiles.threadpool.run_in_executor
+
+    def counting(loop, executor, func):
+        jobs.append(func)
+        return run_in_executor(loop, executor, func)
+
+    monkeypatch.setattr(aiofiles.threadpool, "run_in_executor", counting)
+    assert await aiofiles.read_text(TEST_FILE) == TEST_FILE_CONTENTS
+    assert len(jobs) == 1
@@ -0,0 +1,165 @@
+"""Tests for read-ahead."""
+
+import asyncio
+import io
+
+import pytest
+
+import aiofiles.threadpool.readahead
+from aiofiles.threadpool import open as aioopen
+
+DATA = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(DATA)
+    return path
+
+
+@pytest.mark.parametrize("buffering", [-1, 0])
+@pytest.mark.parametrize("size", [1, 100, 1000, 3000])
+async def test_read_ahead(path, buffering, size):
+    """Sequential reads are served from chunks read ahead."""
+    async with aioopen(path, "rb", buffering=buffering) as f:
+        f.enable_read_ahead(chunk_size=1024, depth=3)
+        chunks = []
+        while chunk := await f.read(size):
+            chunks.append(chunk)
+        assert await f.read(size) == b""
+
+    assert b"".join(chunks) == DATA
+    assert all(len(chunk) == size for chunk in chunks[:-1])
+
+
+async def test_reads_in_flight(path):
+    """Up to `depth` chunks are read ahead of the consumer."""
+    async with aioopen(path, "rb") as f:
+        f.enable_read_ahead(chunk_size=1024, depth=3)
+        assert await f.read(10) == DATA[:10]
+        read_ahead = f._read_ahead
+        assert len(read_ahead._jobs) == 3
+        await asyncio.gather(*(job for job, _ in read_ahead._jobs))
+        assert await f.read(10) == DATA[10:20]
+
+
+async def test_readinto_and_read_all(path):
+    """readinto() and unsized reads are served too."""
+    async with aioopen(path, "rb", buffering=0) as f:
+        f.enable_read_ahead(chunk_size=1000)
+        buffer = bytearray(1500)
+        assert await f.readinto(buffer) == 1500
+        assert buffer == DATA[:1500]
+        assert await f.read() == DATA[1500:]
+        assert await f.read() == b""
+
+
+async def test_other_calls_disable_read_ahead(path):
+    """Other calls see the position of the consumer, and disable read-ahead."""
+    async with aioopen(path, "rb") as f:
+        f.enable_read_ahead(chunk_size=1024, depth=4)
+        assert await f.read(100) == DATA[:100]
+        assert await f.tell() == 100
+        assert f._read_ahead is None
+
+        f.enable_read_ahead(chunk_size=1024, depth=4)
+        assert await f.read(2000) == DATA[100:2100]
+        await f.seek(50)
+        assert await f.read(10) == DATA[50:60]
+
+        f.enable_read_ahead(chunk_size=1024, depth=4)
+        await f.read(10)
+        assert await f.readline() == DATA[70 : DATA.index(b"\n", 70) + 1]
+
+
+async def test_growing_file(path):
+    """Reads past the end of the file pick up data appended since."""
+    async with aioopen(path, "rb") as f:
+        f.enable_read_ahead(chunk_size=4096)
+        assert await f.read() == DATA
+        with path.open("ab") as appender:
+            appender.write(b"more")
+        assert await f.read(10) == b"more"
+
+
+async def test_cancelled_read(path):
+    """A cancelled read loses no data."""
+    async with aioopen(path, "rb") as f:
+        f.enable_read_ahead(chunk_size=100, depth=1)
+        task = asyncio.ensure_future(f.read(1000))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert await f.read(len(DATA)) == DATA
+
+
+async def test_with_write_behind(path):
+    """Reads and writes mixed with write-behind land where they should."""
+    reference = io.BytesIO(DATA)
+    async with aioopen(path, "rb+") as f:
+        f.enable_write_behind(flush_delay=1)
+        f.enable_read_ahead(chunk_size=8, depth=2)
+        for op, arg in [
+            ("write", b"XYZ"),
+            ("read", 5),
+            ("enable", None),
+            ("read", 4),
+            ("write", b"CC"),
+            ("read", 20),
+            ("enable", None),
+            ("read", 3),
+            ("write", b"D" * 30),
+            ("read", 9),
+        ]:
+            if op == "enable":
+                f.enable_read_ahead(chunk_size=8, depth=2)
+            elif op == "read":
+                assert await f.read(arg) == reference.read(arg)
+            else:
+                await f.write(arg)
+                reference.write(arg)
+        assert await f.tell() == reference.tell()
+
+    assert path.read_bytes() == reference.getvalue()
+
+
+@pytest.mark.parametrize("buffering", [-1, 0])
+async def test_concurrent_calls(path, buffering):
+    """Calls issued while reads are running wait for them, in order."""
+    async with aioopen(path, "rb+", buffering=buffering) as f:
+        f.enable_read_ahead(chunk_size=1024, depth=2)
+        assert await asyncio.gather(f.read(5000), f.tell(), f.read(10)) == [
+            DATA[:5000],
+            5000,
+            DATA[5000:5010],
+        ]
+
+        f.enable_read_ahead(chunk_size=1024, depth=2)
+        assert await asyncio.gather(
+            f.read(3000), f.read(), f.seek(20), f.read(10), f.tell()
+        ) == [DATA[5010:8010], DATA[8010:], 20, DATA[20:30], 30]
+
+
+async def test_concurrent_write_behind(path):
+    """Writes issued while reads are running go after them."""
+    async with aioopen(path, "rb+") as f:
+        f.enable_write_behind(flush_delay=1)
+        f.enable_read_ahead(chunk_size=1024, depth=2)
+        assert await asyncio.gather(f.read(2000), f.write(b"XY"), f.read(5)) == [
+            DATA[:2000],
+            2,
+            DATA[2002:2007],
+        ]
+        assert await f.tell() == 2007
+
+    assert path.read_bytes() == DATA[:2000] + b"XY" + DATA[2002:]
+
+
+def test_invalid_settings():
+    """Sizes must be positive."""
+    with pytest.raises(ValueError, match="chunk_size"):
+        aiofiles.threadpool.readahead.ReadAhead(None, 0, 1)
+    with pytest.raises(ValueError, match="depth"):
+        aiofiles.threadpool.readahead.ReadAhead(None, 1, 0)
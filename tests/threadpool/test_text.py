@@ -1,6 +1,7 @@
 """PEP 0492/Python 3.5+ tests for text files."""
 
 import io
+import os
 from os.path import dirname, join
 
 import pytest
@@ -38,6 +39,33 @@ async def test_simple_iteration(mode):
     assert file.closed
 
 
+@pytest.mark.parametrize("mode", ["r", "r+", "a+"])
+async def test_chunked_iteration(mode):
+    """Test iterating over lines from a file, a chunk at a time."""
+    filename = join(dirname(__file__), "..", "resources", "multiline_file.txt")
+
+    async with aioopen(filename, mode=mode) as file:
+        # Append mode needs us to seek.
+        await file.seek(0)
+
+        counter = 1
+        async for line in file.iter_lines(chunk_size=8):
+            assert line.strip() == "line " + str(counter)
+            counter += 1
+
+        assert counter == 5
+
+        await file.seek(0)
+        async for line in file.iter_lines():
+            assert line.strip().endswith("1")
+            break
+
+        # The whole (small) file was fetched at once.
+        assert await file.read() == ""
+
+    assert file.closed
+
+
 @pytest.mark.parametrize("mode", ["r", "r+", "a+"])
 async def test_simple_readlines(mode):
     """Test the readlines functionality."""
@@ -275,3 +303,17 @@ async def test_mode_property(mode):
         assert file.mode == mode
 
     assert file.closed
+
+
+async def test_sync_methods(tmpdir):
+    """Test syncing text files, with buffered data flushed first."""
+    filename = str(tmpdir.join("file.txt"))
+
+    async with aioopen(filename, mode="w") as file:
+        await file.write("data")
+        await file.fsync()
+        assert os.path.getsize(filename) == 4
+
+        if hasattr(os, "posix_fallocate"):
+            await file.fallocate(4, 100)
+            assert os.path.getsize(filename) == 104
@@ -0,0 +1,130 @@
+"""Tests for write-behind buffering."""
+
+import asyncio
+
+import pytest
+
+import aiofiles.threadpool.binary
+import aiofiles.threadpool.utils
+import aiofiles.threadpool.writebehind
+from aiofiles.threadpool import open as aioopen
+
+
+async def test_write_behind(tmp_path):
+    """Writes are buffered, and written out by flushes and closing."""
+    path = tmp_path / "file"
+
+    async with aioopen(path, "wb") as f:
+        f.enable_write_behind(flush_size=1024, flush_delay=60)
+        assert await f.write(b"a" * 100) == 100
+        assert await f.write(memoryview(b"b" * 100)) == 100
+        assert path.read_bytes() == b""
+
+        await f.flush()
+        assert path.read_bytes() == b"a" * 100 + b"b" * 100
+
+        await f.write(b"c")
+
+    assert path.read_bytes() == b"a" * 100 + b"b" * 100 + b"c"
+
+
+async def test_write_behind_thresholds(tmp_path):
+    """Buffered data is written once large enough, or after a delay."""
+    path = tmp_path / "file"
+
+    async with aioopen(path, "wb") as f:
+        f.enable_write_behind(flush_size=10, flush_delay=0.01)
+        write_behind = f._write_behind
+        await f.write(b"x" * 10)
+        assert write_behind._buffer == b""
+        await f.write(b"y")
+        assert write_behind._buffer == b"y"
+        await asyncio.sleep(0.1)
+        assert write_behind._buffer == b""
+        assert write_behind._pending == 0
+
+    assert path.read_bytes() == b"x" * 10 + b"y"
+
+
+async def test_write_behind_ordering(tmp_path):
+    """Other calls see the effects of buffered writes."""
+    path = tmp_path / "file"
+
+    async with aioopen(path, "wb+") as f:
+        f.enable_write_behind(flush_delay=60)
+        await f.write(b"0123456789")
+        assert await f.tell() == 10
+        await f.seek(2)
+        await f.write(b"ab")
+        await f.seek(0)
+        assert await f.read() == b"01ab456789"
+
+
+async def test_write_behind_backpressure(tmp_path, monkeypatch):
+    """Writes wait while too much data is pending."""
+    path = tmp_path / "file"
+    pending = []
+
+    async with aioopen(path, "wb") as f:
+        f.enable_write_behind(flush_size=10, high_water=30)
+        for _ in range(20):
+            await f.write(b"x" * 10)
+            pending.append(f._write_behind._pending)
+
+    assert max(pending) <= 30
+    assert path.read_bytes() == b"x" * 200
+
+
+async def test_write_behind_errors(tmp_path):
+    """Errors of background writes are raised by the next call."""
+    path = tmp_path / "file"
+    path.write_bytes(b"")
+
+    async with aioopen(path, "rb") as f:
+        f.enable_write_behind(flush_size=1)
+        await f.write(b"x")
+        await asyncio.sleep(0.1)
+        with pytest.raises(OSError):
+            await f.write(b"y")
+
+    f = await aioopen(path, "rb")
+    f.enable_write_behind(flush_delay=60)
+    await f.write(b"x")
+    with pytest.raises(OSError):
+        await f.flush()
+    await f.close()
+
+    with pytest.raises(OSError):
+        async with aioopen(path, "rb") as f:
+            f.enable_write_behind(flush_delay=60)
+            await f.write(b"x")
+    assert f.closed
+
+
+async def test_write_behind_disabled(tmp_path, monkeypatch):
+    """Without write-behind, every write goes to the executor."""
+    path = tmp_path / "file"
+    calls = []
+    submit = aiofiles.threadpool.utils.submit
+
+    def counting(obj, cb):
+        calls.append(cb)
+        return submit(obj, cb)
+
+    monkeypatch.setattr(aiofiles.threadpool.binary, "submit", counting)
+    async with aioopen(path, "wb") as f:
+        await f.write(b"a")
+        await f.write(b"b")
+        assert path.read_bytes() == b""
+        await f.flush()
+
+    assert len(calls) == 3
+    assert path.read_bytes() == b"ab"
+
+
+def test_invalid_settings():
+    """Sizes must be positive, and the delay not negative."""
+    with pytest.raises(ValueError, match="flush_size"):
+        aiofiles.threadpool.writebehind.WriteBehind(None, 0, 1, 1)
+    with pytest.raises(ValueError, match="flush_delay"):
+        aiofiles.threadpool.writebehind.WriteBehind(None, 1, -1, 1)